@@ -14,12 +14,45 @@ from typing import List, Set, Dict, Optional
 
 from knowledge_graph import KnowledgeGraph
 
+# Keywords to look for, mapped to the concept they indicate
+_KEYWORDS = {
+    "Storage API": "Concept:StorageAPI",
+    "Jobs API": "Concept:JobsAPI",
+    "Stack URL": "Concept:StackURL",
+    "Project ID": "Concept:ProjectID",
+    "Token": "Concept:Authentication",
+    "Input Mapping": "Concept:InputMapping",
+    "Output Mapping": "Concept:OutputMapping",
+    "Custom Python": "Concept:CustomPython",
+    "Streamlit": "Concept:Streamlit",
+    "Flow": "Concept:Flows"
+}
+_CONCEPT_BY_KEYWORD = {k.lower(): v for k, v in _KEYWORDS.items()}
+_CONCEPT_NAMES = {cid: cid.split(":", 1)[1] for cid in set(_KEYWORDS.values())}
+
+# Single alternation over all keywords, so text is scanned once regardless
+# of how many keywords there are (longest first to prefer longer matches).
+# ASCII-only case folding keeps every match a key of _CONCEPT_BY_KEYWORD;
+# Unicode folding would also match e.g. "ſtreamlit" or "Project İD".
+_CONCEPT_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_KEYWORDS, key=len, reverse=True)),
+    re.IGNORECASE | re.ASCII
+)
+
+# File references, e.g. docs/keboola/something.md or skills/claude/SKILL.md
+_FILE_RE = re.compile(r'(?:docs|skills)/[\w/\-]+\.(?:md|py|yaml)')
+
+# "Fixes #N" style issue references in PR title/body
+_FIXES_RE = re.compile(r'(?:fixes|closes|resolves)\s+#(\d+)', re.IGNORECASE)
+
 
 class GitHubEventHandler:
     """Handle GitHub events and update knowledge graph."""
 
     def __init__(self, graph: Optional[KnowledgeGraph] = None):
         self.graph = graph or KnowledgeGraph()
+        # Concept nodes already written by this handler
+        self._known_concepts: Set[str] = set()
 
     def extract_concepts_from_text(self, text: str) -> Set[str]:
         """
@@ -27,41 +60,19 @@ class GitHubEventHandler:
 
         This is a simple keyword-based extraction. In production,
         could use NLP or LLM-based extraction.
+
+        >>> handler = GitHubEventHandler(KnowledgeGraph(":memory:"))
+        >>> sorted(handler.extract_concepts_from_text("STREAMLIT flow, ſtreamlit, Project İD"))
+        ['Concept:Flows', 'Concept:Streamlit']
         """
-        concepts = set()
-
-        # Keywords to look for
-        keywords = {
-            "Storage API": "Concept:StorageAPI",
-            "Jobs API": "Concept:JobsAPI",
-            "Stack URL": "Concept:StackURL",
-            "Project ID": "Concept:ProjectID",
-            "Token": "Concept:Authentication",
-            "Input Mapping": "Concept:InputMapping",
-            "Output Mapping": "Concept:OutputMapping",
-            "Custom Python": "Concept:CustomPython",
-            "Streamlit": "Concept:Streamlit",
-            "Flow": "Concept:Flows"
+        return {
+            _CONCEPT_BY_KEYWORD[match.lower()]
+            for match in _CONCEPT_RE.findall(text)
         }
 
-        text_lower = text.lower()
-        for keyword, concept_id in keywords.items():
-            if keyword.lower() in text_lower:
-                concepts.add(concept_id)
-
-        return concepts
-
     def extract_files_from_text(self, text: str) -> Set[str]:
         """Extract file paths mentioned in text."""
-        files = set()
-
-        # Look for markdown file references
-        # Pattern: docs/keboola/something.md or skills/claude/SKILL.md
-        pattern = r'(?:docs|skills)/[\w/\-]+\.(?:md|py|yaml)'
-        matches = re.findall(pattern, text)
-        files.update(matches)
-
-        return files
+        return set(_FILE_RE.findall(text))
 
     def handle_issue_created(self, issue_number: int, issue_data: Dict):
         """
@@ -93,13 +104,16 @@ class GitHubEventHandler:
         concepts = self.extract_concepts_from_text(full_text)
 
         for concept_id in concepts:
+            concept_name = _CONCEPT_NAMES[concept_id]
+
             # Create concept node if it doesn't exist
-            concept_name = concept_id.split(":")[1]
-            self.graph.add_node(
-                node_type="Concept",
-                node_id=concept_name,
-                name=concept_name
-            )
+            if concept_id not in self._known_concepts:
+                self.graph.add_node(
+                    node_type="Concept",
+                    node_id=concept_name,
+                    name=concept_name
+                )
+                self._known_concepts.add(concept_id)
 
             # Link issue to concept
             self.graph.add_edge(issue_id, concept_id, "ABOUT")
@@ -159,8 +173,7 @@ class GitHubEventHandler:
 
         # Extract "Fixes #N" from PR body/title
         full_text = f"{pr_data['title']} {pr_data.get('body', '')}"
-        fixes_pattern = r'(?:fixes|closes|resolves)\s+#(\d+)'
-        matches = re.findall(fixes_pattern, full_text.lower())
+        matches = _FIXES_RE.findall(full_text)
 
         for issue_num in matches:
             issue_id = f"Issue:{issue_num}"
@@ -249,33 +262,35 @@ def main():
     handler = GitHubEventHandler()
 
     try:
-        if args.command == "issue":
-            if args.action == "created":
-                if not args.data:
-                    print("❌ Error: --data required for issue creation")
-                    return 1
+        # One transaction per event instead of a commit per graph write
+        with handler.graph.bulk():
+            if args.command == "issue":
+                if args.action == "created":
+                    if not args.data:
+                        print("❌ Error: --data required for issue creation")
+                        return 1
 
-                with open(args.data) as f:
-                    issue_data = json.load(f)
+                    with open(args.data) as f:
+                        issue_data = json.load(f)
 
-                handler.handle_issue_created(args.number, issue_data)
+                    handler.handle_issue_created(args.number, issue_data)
 
-            elif args.action == "closed":
-                handler.handle_issue_closed(args.number)
+                elif args.action == "closed":
+                    handler.handle_issue_closed(args.number)
 
-        elif args.command == "pr":
-            if args.action == "created":
-                if not args.data:
-                    print("❌ Error: --data required for PR creation")
-                    return 1
+            elif args.command == "pr":
+                if args.action == "created":
+                    if not args.data:
+                        print("❌ Error: --data required for PR creation")
+                        return 1
 
-                with open(args.data) as f:
-                    pr_data = json.load(f)
+                    with open(args.data) as f:
+                        pr_data = json.load(f)
 
-                handler.handle_pr_created(args.number, pr_data)
+                    handler.handle_pr_created(args.number, pr_data)
 
-            elif args.action == "merged":
-                handler.handle_pr_merged(args.number)
+                elif args.action == "merged":
+                    handler.handle_pr_merged(args.number)
 
         return 0
 
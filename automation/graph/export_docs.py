@@ -7,13 +7,23 @@ git history, including commits, authors, dates, and change statistics.
 """
 
 import argparse
+import heapq
 import json
+import logging
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used otherwise
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 
 class GitHistoryExtractor:
@@ -28,59 +38,39 @@ class GitHistoryExtractor:
         """
         self.repo_root = repo_root
 
-    def get_file_history(self, file_path: Path) -> List[Dict]:
+    def get_file_history(self, file_path: Path, include_stats: bool = True) -> List[Dict]:
         """
         Get complete git history for a file using git log --follow.
 
+        Change statistics are requested with --numstat in the same git log
+        call, so only a single subprocess is spawned per file.
+
         Args:
             file_path: Path to the file (relative to repo root)
+            include_stats: Add insertion/deletion counts to each commit
 
         Returns:
             List of commit dictionaries with metadata
         """
         try:
             # Use git log with --follow to track file renames
-            # Format: hash|author|email|date|subject
+            # Format: NUL, then hash/author/email/date/timestamp/subject separated
+            # by US (0x1f), then numstat lines
             cmd = [
                 'git',
                 'log',
                 '--follow',
-                '--pretty=format:%H|%an|%ae|%aI|%s',
+                *(['--numstat'] if include_stats else []),
+                '--pretty=format:%x00%H%x1f%an%x1f%ae%x1f%aI%x1f%at%x1f%s',
                 '--',
                 str(file_path)
             ]
 
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
             commits = []
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-
-                parts = line.split('|', 4)
-                if len(parts) != 5:
-                    continue
-
-                commit_hash, author, email, date, message = parts
-
-                # Get stats for this commit
-                stats = self._get_commit_stats(commit_hash, file_path)
-
-                commits.append({
-                    'hash': commit_hash,
-                    'short_hash': commit_hash[:7],
-                    'author': author,
-                    'email': email,
-                    'date': date,
-                    'message': message,
-                    'stats': stats
-                })
+            for commit, numstat_lines in self._stream_log(cmd):
+                if include_stats:
+                    commit['stats'] = self._parse_numstat(numstat_lines)
+                commits.append(commit)
 
             return commits
 
@@ -88,56 +78,172 @@ class GitHistoryExtractor:
             print(f"Warning: Failed to get history for {file_path}: {e}", file=sys.stderr)
             return []
 
-    def _get_commit_stats(self, commit_hash: str, file_path: Path) -> Dict[str, int]:
+    def get_all_histories(self, file_paths: List[Path],
+                          include_stats: bool = True) -> Dict[str, List[Dict]]:
         """
-        Get file change statistics for a specific commit.
+        Get git history for many files with a single git log invocation.
+
+        Renames are not followed, because git log --follow only accepts a
+        single path. Use get_file_history when rename tracking is needed.
 
         Args:
-            commit_hash: Git commit hash
-            file_path: Path to the file
+            file_paths: Paths to the files (relative to repo root)
+            include_stats: Add insertion/deletion counts to each commit
 
         Returns:
-            Dictionary with insertions and deletions counts
+            Dictionary mapping each file path (as string) to its commits
         """
+        histories = {str(file_path): [] for file_path in file_paths}
+        if not histories:
+            return histories
+
         try:
+            # --no-renames keeps numstat paths plain so they can be matched
+            # back to the requested files; --name-only lists the same paths
+            # without computing diffs when stats are not needed
             cmd = [
                 'git',
-                'show',
-                '--numstat',
-                '--pretty=format:',
-                commit_hash,
+                '-c', 'core.quotePath=false',
+                'log',
+                '--no-renames',
+                '--numstat' if include_stats else '--name-only',
+                '--pretty=format:%x00%H%x1f%an%x1f%ae%x1f%aI%x1f%at%x1f%s',
                 '--',
-                str(file_path)
+                *histories
             ]
 
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            for commit, file_lines in self._stream_log(cmd):
+                for line in file_lines:
+                    if not include_stats:
+                        if line in histories:
+                            histories[line].append(dict(commit))
+                        continue
 
-            # Parse numstat output: insertions\tdeletions\tfilename
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
+                    stats, path = self._parse_numstat_line(line)
+                    if path in histories:
+                        histories[path].append({**commit, 'stats': stats})
 
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    insertions = parts[0]
-                    deletions = parts[1]
+        except subprocess.CalledProcessError as e:
+            print(f"Warning: Failed to get batched history: {e}", file=sys.stderr)
 
-                    return {
-                        'insertions': int(insertions) if insertions.isdigit() else 0,
-                        'deletions': int(deletions) if deletions.isdigit() else 0
-                    }
+        return histories
 
-        except subprocess.CalledProcessError:
-            pass
+    def _stream_log(self, cmd: List[str]) -> Iterator[Tuple[Dict, List[str]]]:
+        """
+        Run git log and parse its output while it is being produced.
+
+        Expects the NUL-prefixed pretty format, so every header line starts
+        with a NUL and is followed by the file lines of that commit.
+
+        Args:
+            cmd: git log command to run
+
+        Yields:
+            Tuples of (commit metadata, numstat/name lines of that commit)
+
+        Raises:
+            subprocess.CalledProcessError: If git exits with an error
+        """
+        with subprocess.Popen(
+            cmd,
+            cwd=self.repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1 << 16
+        ) as proc:
+            commit = None
+            file_lines = []
+
+            for line in proc.stdout:
+                line = line.rstrip('\n')
+
+                if line.startswith('\x00'):
+                    if commit is not None:
+                        yield commit, file_lines
+                    commit = self._parse_header(line[1:])
+                    file_lines = []
+                elif line and commit is not None:
+                    file_lines.append(line)
+
+            if commit is not None:
+                yield commit, file_lines
+
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+    @staticmethod
+    def _parse_header(line: str) -> Optional[Dict]:
+        """
+        Parse a commit header of unit-separator (0x1f) delimited fields:
+        hash, author, email, date, timestamp, subject.
+
+        Args:
+            line: Header line without the leading NUL
+
+        Returns:
+            Commit metadata dictionary, or None if the line is malformed
+        """
+        parts = line.split('\x1f', 5)
+        if len(parts) != 6:
+            return None
+
+        commit_hash, author, email, date, timestamp, message = parts
+        try:
+            date_ts = int(timestamp)
+        except ValueError:
+            return None
+
+        return {
+            'hash': commit_hash,
+            'short_hash': commit_hash[:7],
+            # Few distinct authors across many commits - share the strings
+            'author': sys.intern(author),
+            'email': sys.intern(email),
+            'date': date,
+            'date_ts': date_ts,
+            'message': message
+        }
+
+    @staticmethod
+    def _parse_numstat(lines: List[str]) -> Dict[str, int]:
+        """
+        Parse numstat lines of a single commit.
+
+        Args:
+            lines: Lines in the form insertions\tdeletions\tfilename
+
+        Returns:
+            Dictionary with insertions and deletions counts
+        """
+        for line in lines:
+            if line:
+                return GitHistoryExtractor._parse_numstat_line(line)[0]
 
         return {'insertions': 0, 'deletions': 0}
 
+    @staticmethod
+    def _parse_numstat_line(line: str) -> Tuple[Dict[str, int], str]:
+        """
+        Parse a single insertions\tdeletions\tfilename numstat line.
+
+        Args:
+            line: Numstat line
+
+        Returns:
+            Tuple of (insertions/deletions counts, filename)
+        """
+        insertions, _, rest = line.partition('\t')
+        deletions, _, path = rest.partition('\t')
+
+        try:
+            stats = {'insertions': int(insertions), 'deletions': int(deletions)}
+        except ValueError:
+            # Binary files are reported as -\t-
+            stats = {'insertions': 0, 'deletions': 0}
+
+        return stats, path
+
     def is_git_repo(self) -> bool:
         """Check if the directory is a git repository."""
         try:
@@ -239,34 +345,54 @@ class GitHistoryExtractor:
 class DocsExporter:
     """Export documentation files with git history to JSON."""
 
-    def __init__(self, docs_dir: Path, repo_root: Path):
+    def __init__(self, docs_dir: Path, repo_root: Path, follow_renames: bool = False,
+                 include_stats: bool = True, verify_repo: bool = True):
         """
         Initialize the documentation exporter.
 
         Args:
             docs_dir: Directory containing documentation files
             repo_root: Root directory of the git repository
+            follow_renames: Query history per file with --follow instead of
+                one batched git log call for all files
+            include_stats: Add insertion/deletion counts to each commit
+            verify_repo: Check that repo_root is a git repository before
+                exporting; callers that already resolved it via git can skip this
         """
         self.docs_dir = docs_dir
         self.repo_root = repo_root
+        self.follow_renames = follow_renames
+        self.include_stats = include_stats
+        self.verify_repo = verify_repo
         self.git_extractor = GitHistoryExtractor(repo_root)
 
     def find_markdown_files(self) -> List[Path]:
         """
         Find all markdown files in the docs directory.
 
+        Tracked files are listed from the git index, which avoids walking the
+        directory tree; the filesystem is only walked if git fails.
+
         Returns:
             List of markdown file paths (relative to repo root)
         """
-        markdown_files = []
-        for root, _, files in os.walk(self.docs_dir):
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = Path(root) / file
-                    # Get path relative to repo root
-                    rel_path = file_path.relative_to(self.repo_root)
-                    markdown_files.append(rel_path)
-        return sorted(markdown_files)
+        docs_rel = self.docs_dir.relative_to(self.repo_root)
+        try:
+            result = subprocess.run(
+                ['git', 'ls-files', '-z', '--', f'{docs_rel.as_posix()}/*.md'],
+                cwd=self.repo_root,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            return sorted(Path(name) for name in result.stdout.split('\x00') if name)
+
+        except subprocess.CalledProcessError as e:
+            print(f"Warning: git ls-files failed, walking {self.docs_dir}: {e}", file=sys.stderr)
+            return sorted(
+                file_path.relative_to(self.repo_root)
+                for file_path in self.docs_dir.rglob('*.md')
+            )
 
     def read_file_content(self, file_path: Path) -> str:
         """
@@ -280,12 +406,52 @@ class DocsExporter:
         """
         full_path = self.repo_root / file_path
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return full_path.read_bytes().decode('utf-8', errors='replace')
         except Exception as e:
             print(f"Warning: Failed to read {file_path}: {e}", file=sys.stderr)
             return ""
 
+    def _process_file(self, file_path: Path,
+                      histories: Optional[Dict[str, List[Dict]]]) -> Dict:
+        """
+        Build the exported document entry for a single markdown file.
+
+        Args:
+            file_path: Path to the file (relative to repo root)
+            histories: Prefetched histories by path, or None to query per file
+
+        Returns:
+            Document dictionary with content, history and blame
+        """
+        logger.info("Processing %s...", file_path)
+
+        content = self.read_file_content(file_path)
+        if histories is not None:
+            history = histories[str(file_path)]
+        else:
+            history = self.git_extractor.get_file_history(
+                file_path, include_stats=self.include_stats
+            )
+        blame = self.git_extractor.get_file_blame(file_path)
+
+        # Get relative path from docs directory for cleaner display
+        try:
+            display_path = file_path.relative_to(self.docs_dir.relative_to(self.repo_root))
+        except ValueError:
+            display_path = file_path
+
+        return {
+            'path': str(file_path),
+            'display_path': str(display_path),
+            'name': file_path.name,
+            'content': content,
+            'history': history,
+            'blame': blame,
+            'commit_count': len(history),
+            'last_modified': history[0]['date'] if history else None,
+            'last_author': history[0]['author'] if history else None
+        }
+
     def export_docs(self) -> Dict:
         """
         Export all documentation files with their git history.
@@ -293,7 +459,7 @@ class DocsExporter:
         Returns:
             Dictionary containing docs array and metadata
         """
-        if not self.git_extractor.is_git_repo():
+        if self.verify_repo and not self.git_extractor.is_git_repo():
             print("Error: Not a git repository", file=sys.stderr)
             sys.exit(1)
 
@@ -302,54 +468,50 @@ class DocsExporter:
         if not markdown_files:
             print(f"Warning: No markdown files found in {self.docs_dir}", file=sys.stderr)
 
-        docs = []
         total_commits = 0
 
-        for file_path in markdown_files:
-            print(f"Processing {file_path}...", file=sys.stderr)
-
-            content = self.read_file_content(file_path)
-            history = self.git_extractor.get_file_history(file_path)
-            blame = self.git_extractor.get_file_blame(file_path)
-
-            # Get relative path from docs directory for cleaner display
-            try:
-                display_path = file_path.relative_to(self.docs_dir.relative_to(self.repo_root))
-            except ValueError:
-                display_path = file_path
-
-            doc = {
-                'path': str(file_path),
-                'display_path': str(display_path),
-                'name': file_path.name,
-                'content': content,
-                'history': history,
-                'blame': blame,
-                'commit_count': len(history),
-                'last_modified': history[0]['date'] if history else None,
-                'last_author': history[0]['author'] if history else None
-            }
-
-            docs.append(doc)
-            total_commits += len(history)
+        histories = None
+        if not self.follow_renames:
+            histories = self.git_extractor.get_all_histories(
+                markdown_files, include_stats=self.include_stats
+            )
 
-        # Calculate statistics - deduplicate commits by hash
+        # Blame (and --follow history) still cost one git call per file;
+        # subprocess waits release the GIL, so threads overlap them well
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            docs = list(executor.map(
+                lambda file_path: self._process_file(file_path, histories),
+                markdown_files
+            ))
+
+        # Single pass over all commits: deduplicate by hash, collect authors
+        # and keep the 10 most recent unique commits in a bounded min-heap.
+        # Entries are (timestamp, -sequence, commit) so that on equal
+        # timestamps the earlier-seen commit is kept and listed first.
+        # The timestamp is only a sort key, so it is popped from every
+        # commit here and stays out of the exported JSON.
         seen_hashes = set()
-        unique_commits = []
+        authors = set()
+        top_commits = []
         for doc in docs:
+            total_commits += doc['commit_count']
             for commit in doc['history']:
-                if commit['hash'] not in seen_hashes:
-                    seen_hashes.add(commit['hash'])
-                    unique_commits.append(commit)
+                # A commit dict shared between files was popped on first sight
+                date_ts = commit.pop('date_ts', None)
+                if commit['hash'] in seen_hashes:
+                    continue
 
-        # Sort by date descending
-        unique_commits.sort(key=lambda c: c['date'], reverse=True)
+                seen_hashes.add(commit['hash'])
+                authors.add(commit['author'])
 
-        # Get recent changes (last 10 unique commits across all files)
-        recent_changes = unique_commits[:10]
+                entry = (date_ts, -len(seen_hashes), commit)
+                if len(top_commits) < 10:
+                    heapq.heappush(top_commits, entry)
+                else:
+                    heapq.heappushpop(top_commits, entry)
 
-        # Get unique authors
-        authors = set(c['author'] for c in unique_commits)
+        # Get recent changes (last 10 unique commits across all files)
+        recent_changes = [entry[2] for entry in sorted(top_commits, reverse=True)]
 
         result = {
             'docs': docs,
@@ -372,6 +534,52 @@ class DocsExporter:
         return result
 
 
+def find_repo_root(path: Path) -> Optional[Path]:
+    """
+    Find the root of the git repository containing a directory.
+
+    Args:
+        path: Directory inside the repository
+
+    Returns:
+        Repository root, or None if the directory is not in a git repository
+    """
+    try:
+        result = subprocess.run(
+            ['git', '-C', str(path), 'rev-parse', '--show-toplevel'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return Path(result.stdout.strip()).resolve()
+    except subprocess.CalledProcessError:
+        return None
+
+
+def dump_json(data: Dict, pretty: bool = False) -> bytes:
+    """
+    Serialize export data to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed, otherwise the stdlib json C encoder
+    (compact separators, since indent forces the pure-Python encoder).
+
+    Args:
+        data: Data to serialize
+        pretty: Indent the output by two spaces
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    if pretty:
+        output = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        output = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return output.encode('utf-8')
+
+
 def main():
     """Main entry point for the export script."""
     parser = argparse.ArgumentParser(
@@ -387,27 +595,41 @@ def main():
         required=True,
         help='Output JSON file path'
     )
+    parser.add_argument(
+        '--follow',
+        action='store_true',
+        help='Track history across renames (one git log call per file)'
+    )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Indent the JSON output (slower and larger)'
+    )
+    parser.add_argument(
+        '--no-stats',
+        dest='stats',
+        action='store_false',
+        help='Skip per-commit insertion/deletion counts'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='Do not report progress for each processed file'
+    )
 
     args = parser.parse_args()
 
+    # Per-file progress goes through logging so --quiet skips it entirely
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format='%(message)s',
+        stream=sys.stderr
+    )
+
     # Resolve paths
     docs_dir = Path(args.docs).resolve()
     output_file = Path(args.output).resolve()
 
-    # Find git repository root
-    current_dir = docs_dir
-    repo_root = None
-
-    while current_dir != current_dir.parent:
-        if (current_dir / '.git').exists():
-            repo_root = current_dir
-            break
-        current_dir = current_dir.parent
-
-    if not repo_root:
-        print("Error: Could not find git repository root", file=sys.stderr)
-        sys.exit(1)
-
     # Validate docs directory
     if not docs_dir.exists():
         print(f"Error: Docs directory does not exist: {docs_dir}", file=sys.stderr)
@@ -417,6 +639,13 @@ def main():
         print(f"Error: Docs path is not a directory: {docs_dir}", file=sys.stderr)
         sys.exit(1)
 
+    # Find git repository root (this also verifies it is a git repository)
+    repo_root = find_repo_root(docs_dir)
+
+    if not repo_root:
+        print("Error: Could not find git repository root", file=sys.stderr)
+        sys.exit(1)
+
     # Create output directory if needed
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
@@ -425,12 +654,18 @@ def main():
     print(f"Repository root: {repo_root}", file=sys.stderr)
     print(f"Output file: {output_file}", file=sys.stderr)
 
-    exporter = DocsExporter(docs_dir, repo_root)
+    exporter = DocsExporter(
+        docs_dir,
+        repo_root,
+        follow_renames=args.follow,
+        include_stats=args.stats,
+        verify_repo=False
+    )
     result = exporter.export_docs()
 
     # Write JSON output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(dump_json(result, pretty=args.pretty))
 
     print(f"\nExport complete:", file=sys.stderr)
     print(f"  - {result['metadata']['doc_count']} documents", file=sys.stderr)
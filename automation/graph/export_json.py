@@ -7,11 +7,36 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import sqlite3
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used otherwise
+    orjson = None
+
+
+def _loads(data: str) -> Any:
+    """Decode a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _default_label(properties: Dict) -> str:
+    """Label for node types without a dedicated builder."""
+    return properties.get('name') or properties.get('title') or 'Unknown'
 
 
 class GraphExporter:
@@ -46,6 +71,13 @@ class GraphExporter:
         }
     }
 
+    # Styling for node types missing from NODE_STYLES
+    DEFAULT_NODE_STYLE = {
+        'color': '#95A5A6',
+        'shape': 'dot',
+        'icon': '⚪'
+    }
+
     # Edge type styling configuration
     EDGE_STYLES = {
         'ABOUT': {'color': '#95A5A6', 'dashes': False},
@@ -56,9 +88,109 @@ class GraphExporter:
         'INCLUDES': {'color': '#1ABC9C', 'dashes': True}
     }
 
+    # Styling for relationships missing from EDGE_STYLES
+    DEFAULT_EDGE_STYLE = {'color': '#95A5A6', 'dashes': False}
+
+    # Node properties read by _build_node_label/_build_node_tooltip
+    LABEL_FIELDS = ('path', 'number', 'title', 'status', 'name')
+
+    # Nodes with compacted properties JSON and the label fields pulled out.
+    # No ORDER BY: vis.js lays the graph out itself, and a plain scan keeps
+    # SQLite from sorting on the unindexed created_at column
+    NODE_QUERY = (
+        "SELECT id, type, json(properties) AS properties, "
+        + ", ".join(f"json_extract(properties, '$.{field}') AS {field}" for field in LABEL_FIELDS)
+        + " FROM nodes"
+    )
+
+    # Label per node type; other types fall back to _default_label
+    LABEL_BUILDERS = {
+        # Use filename from path
+        'Document': lambda p: Path(p.get('path', 'Unknown')).stem,
+        'Issue': lambda p: f"Issue #{p.get('number', '?')}",
+        'PullRequest': lambda p: f"PR #{p.get('number', '?')}",
+        'Concept': lambda p: p.get('name', 'Unknown Concept'),
+        'Skill': lambda p: p.get('name', 'Unknown Skill'),
+    }
+
+    # Tooltip lines following the type header; other types get the header only
+    TOOLTIP_BUILDERS = {
+        'Document': lambda p: [f"Path: {p.get('path', 'Unknown')}"],
+        'Issue': lambda p: [
+            f"#{p.get('number', '?')}: {p.get('title', 'Untitled')}",
+            f"Status: {p.get('status', 'unknown')}"
+        ],
+        'PullRequest': lambda p: [
+            f"#{p.get('number', '?')}: {p.get('title', 'Untitled')}",
+            f"Status: {p.get('status', 'unknown')}"
+        ],
+        'Concept': lambda p: [p.get('name', 'Unknown')],
+        'Skill': lambda p: [p.get('name', 'Unknown')],
+    }
+
+    # Number of rows fetched from SQLite per batch
+    FETCH_SIZE = 8192
+
     def __init__(self):
         self.nodes = []
         self.edges = []
+        self._build_templates()
+
+    def _build_templates(self):
+        """
+        Precompute the vis.js fields shared by all nodes/edges of a type.
+
+        Exported nodes and edges share these nested dicts, so only the
+        per-row fields are built for each row.
+        """
+        self._node_templates = {
+            node_type: self._node_template(style)
+            for node_type, style in self.NODE_STYLES.items()
+        }
+        self._default_node_template = self._node_template(self.DEFAULT_NODE_STYLE)
+
+        self._edge_templates = {
+            relationship: self._edge_template(relationship, style)
+            for relationship, style in self.EDGE_STYLES.items()
+        }
+
+    def _node_template(self, style: Dict[str, str]) -> Dict[str, Any]:
+        """Build the shared vis.js fields for a node style."""
+        return {
+            'shape': style['shape'],
+            'color': {
+                'background': style['color'],
+                'border': self._darken_color(style['color']),
+                'highlight': {
+                    'background': style['color'],
+                    'border': '#000000'
+                }
+            },
+            'font': {
+                'color': '#333333',
+                'size': 14
+            }
+        }
+
+    def _edge_template(self, relationship: str, style: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the shared vis.js fields for a relationship."""
+        return {
+            'label': relationship.replace('_', ' '),
+            'arrows': 'to',
+            'color': {
+                'color': style['color'],
+                'highlight': '#000000'
+            },
+            'dashes': style['dashes'],
+            'font': {
+                'size': 11,
+                'color': '#666666',
+                'align': 'middle'
+            },
+            'smooth': {
+                'type': 'continuous'
+            }
+        }
 
     def connect_db(self, db_path: Path) -> sqlite3.Connection:
         """Connect to SQLite database."""
@@ -75,153 +207,116 @@ class GraphExporter:
 
     def export_nodes(self, conn: sqlite3.Connection) -> List[Dict[str, Any]]:
         """Export all nodes from the graph."""
+        return list(self.iter_nodes(conn))
+
+    def iter_nodes(self, conn: sqlite3.Connection) -> Iterator[Dict[str, Any]]:
+        """Yield vis.js nodes one at a time while reading the nodes table."""
+        for vis_node, properties in self._iter_node_rows(conn):
+            vis_node['properties'] = _loads(properties)
+            yield vis_node
+
+    def _iter_node_rows(self, conn: sqlite3.Connection) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """
+        Yield (vis.js node without properties, properties JSON text) pairs.
+
+        Only the fields used for labels and tooltips are extracted by SQLite,
+        so the properties document itself is never decoded in Python.
+        """
         if conn is None:
-            return []
+            return
 
         print("📦 Exporting nodes...")
 
-        cursor = conn.execute("SELECT * FROM nodes ORDER BY created_at")
-        nodes = []
-
-        for row in cursor:
-            node_id = row['id']
-            node_type = row['type']
-            properties = json.loads(row['properties'])
+        cursor = conn.execute(self.NODE_QUERY)
+        count = 0
 
-            # Get node styling
-            style = self.NODE_STYLES.get(node_type, {
-                'color': '#95A5A6',
-                'shape': 'dot',
-                'icon': '⚪'
-            })
+        get_template = self._node_templates.get
+        default_template = self._default_node_template
+        label_fields = self.LABEL_FIELDS
 
-            # Build node label
-            label = self._build_node_label(node_type, properties)
+        for row in self._fetch_rows(cursor):
+            node_type = row['type']
+            fields = {
+                field: row[field] for field in label_fields
+                if row[field] is not None
+            }
 
-            # Build vis.js node
+            # Build vis.js node from the shared per-type styling
             vis_node = {
-                'id': node_id,
-                'label': label,
+                'id': row['id'],
+                'label': self._build_node_label(node_type, fields),
                 'type': node_type,
-                'shape': style['shape'],
-                'color': {
-                    'background': style['color'],
-                    'border': self._darken_color(style['color']),
-                    'highlight': {
-                        'background': style['color'],
-                        'border': '#000000'
-                    }
-                },
-                'font': {
-                    'color': '#333333',
-                    'size': 14
-                },
-                'title': self._build_node_tooltip(node_type, properties),
-                'properties': properties
+                **get_template(node_type, default_template),
+                'title': self._build_node_tooltip(node_type, fields)
             }
 
-            nodes.append(vis_node)
+            yield vis_node, row['properties']
+            count += 1
 
-        print(f"  ✓ Exported {len(nodes)} nodes")
-        return nodes
+        print(f"  ✓ Exported {count} nodes")
+
+    def _fetch_rows(self, cursor: sqlite3.Cursor) -> Iterator[sqlite3.Row]:
+        """Yield rows from a cursor, fetching them in FETCH_SIZE batches."""
+        while True:
+            rows = cursor.fetchmany(self.FETCH_SIZE)
+            if not rows:
+                return
+            yield from rows
 
     def export_edges(self, conn: sqlite3.Connection) -> List[Dict[str, Any]]:
         """Export all edges from the graph."""
+        return list(self.iter_edges(conn))
+
+    def iter_edges(self, conn: sqlite3.Connection) -> Iterator[Dict[str, Any]]:
+        """Yield vis.js edges one at a time while reading the edges table."""
         if conn is None:
-            return []
+            return
 
         print("🔗 Exporting edges...")
 
-        cursor = conn.execute("SELECT * FROM edges ORDER BY created_at")
-        edges = []
+        cursor = conn.execute("SELECT * FROM edges")
+        count = 0
 
-        for row in cursor:
-            edge_id = row['id']
-            from_id = row['from_id']
-            to_id = row['to_id']
+        templates = self._edge_templates
+
+        for row in self._fetch_rows(cursor):
             relationship = row['relationship']
 
-            # Get edge styling
-            style = self.EDGE_STYLES.get(relationship, {
-                'color': '#95A5A6',
-                'dashes': False
-            })
+            template = templates.get(relationship)
+            if template is None:
+                template = templates[relationship] = self._edge_template(
+                    relationship, self.DEFAULT_EDGE_STYLE
+                )
 
-            # Build vis.js edge
+            # Build vis.js edge from the shared per-relationship styling
             vis_edge = {
-                'id': edge_id,
-                'from': from_id,
-                'to': to_id,
-                'label': relationship.replace('_', ' '),
-                'arrows': 'to',
-                'color': {
-                    'color': style['color'],
-                    'highlight': '#000000'
-                },
-                'dashes': style['dashes'],
-                'font': {
-                    'size': 11,
-                    'color': '#666666',
-                    'align': 'middle'
-                },
-                'smooth': {
-                    'type': 'continuous'
-                }
+                'id': row['id'],
+                'from': row['from_id'],
+                'to': row['to_id'],
+                **template
             }
 
-            edges.append(vis_edge)
+            yield vis_edge
+            count += 1
 
-        print(f"  ✓ Exported {len(edges)} edges")
-        return edges
+        print(f"  ✓ Exported {count} edges")
 
     def _build_node_label(self, node_type: str, properties: Dict) -> str:
         """Build display label for a node."""
-        if node_type == 'Document':
-            # Use filename from path
-            path = properties.get('path', 'Unknown')
-            return Path(path).stem
-
-        elif node_type == 'Issue':
-            number = properties.get('number', '?')
-            return f"Issue #{number}"
-
-        elif node_type == 'PullRequest':
-            number = properties.get('number', '?')
-            return f"PR #{number}"
-
-        elif node_type == 'Concept':
-            return properties.get('name', 'Unknown Concept')
-
-        elif node_type == 'Skill':
-            return properties.get('name', 'Unknown Skill')
-
-        else:
-            return properties.get('name') or properties.get('title') or 'Unknown'
+        return self.LABEL_BUILDERS.get(node_type, _default_label)(properties)
 
     def _build_node_tooltip(self, node_type: str, properties: Dict) -> str:
         """Build HTML tooltip for a node."""
         lines = [f"<b>{node_type}</b>"]
-
-        if node_type == 'Document':
-            lines.append(f"Path: {properties.get('path', 'Unknown')}")
-
-        elif node_type == 'Issue':
-            lines.append(f"#{properties.get('number', '?')}: {properties.get('title', 'Untitled')}")
-            lines.append(f"Status: {properties.get('status', 'unknown')}")
-
-        elif node_type == 'PullRequest':
-            lines.append(f"#{properties.get('number', '?')}: {properties.get('title', 'Untitled')}")
-            lines.append(f"Status: {properties.get('status', 'unknown')}")
-
-        elif node_type == 'Concept':
-            lines.append(properties.get('name', 'Unknown'))
-
-        elif node_type == 'Skill':
-            lines.append(properties.get('name', 'Unknown'))
+        build = self.TOOLTIP_BUILDERS.get(node_type)
+        if build is not None:
+            lines.extend(build(properties))
 
         return '<br>'.join(lines)
 
-    def _darken_color(self, hex_color: str, percent: int = 20) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _darken_color(hex_color: str, percent: int = 20) -> str:
         """Darken a hex color by a percentage."""
         # Simple darkening - reduce RGB values
         hex_color = hex_color.lstrip('#')
@@ -233,6 +328,19 @@ class GraphExporter:
 
         return f'#{r:02x}{g:02x}{b:02x}'
 
+    @staticmethod
+    def _write_array(f: BinaryIO, items: Iterable[bytes]) -> int:
+        """Write encoded items as a JSON array one at a time, returning the count."""
+        count = 0
+        f.write(b'[')
+        for item in items:
+            if count:
+                f.write(b',')
+            f.write(item)
+            count += 1
+        f.write(b']')
+        return count
+
     def export(self, db_path: Path, output_path: Path):
         """Main export process."""
         print("=" * 70)
@@ -243,41 +351,44 @@ class GraphExporter:
         # Connect to database
         conn = self.connect_db(db_path)
 
-        # Export nodes and edges
-        nodes = self.export_nodes(conn)
-        edges = self.export_edges(conn)
-
-        # Close connection
-        if conn:
-            conn.close()
-
-        # Build output JSON
-        graph_data = {
-            'metadata': {
-                'exported_at': datetime.utcnow().isoformat() + 'Z',
-                'node_count': len(nodes),
-                'edge_count': len(edges),
-                'version': '1.0',
-                'generator': 'export_json.py'
-            },
-            'nodes': nodes,
-            'edges': edges
-        }
-
-        # Write to output file
+        # Stream nodes and edges straight to the output file, so the graph is
+        # never held in memory as a whole. Metadata goes last because the
+        # counts are only known once both tables have been read.
         print(f"💾 Writing to: {output_path}")
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(json.dumps(graph_data, indent=2), encoding='utf-8')
 
-        print(f"  ✓ File size: {len(json.dumps(graph_data))} bytes")
+        try:
+            with open(output_path, 'wb') as f:
+                f.write(b'{"nodes":')
+                node_count = self._write_array(f, (
+                    # Splice the stored properties JSON in as-is
+                    _dumps(vis_node)[:-1] + b',"properties":' + properties.encode('utf-8') + b'}'
+                    for vis_node, properties in self._iter_node_rows(conn)
+                ))
+                f.write(b',"edges":')
+                edge_count = self._write_array(f, map(_dumps, self.iter_edges(conn)))
+                f.write(b',"metadata":')
+                f.write(_dumps({
+                    'exported_at': datetime.utcnow().isoformat() + 'Z',
+                    'node_count': node_count,
+                    'edge_count': edge_count,
+                    'version': '1.0',
+                    'generator': 'export_json.py'
+                }))
+                f.write(b'}')
+        finally:
+            if conn:
+                conn.close()
+
+        print(f"  ✓ File size: {output_path.stat().st_size} bytes")
         print()
 
         # Summary
         print("=" * 70)
         print("✅ Export complete!")
         print("=" * 70)
-        print(f"Nodes: {len(nodes)}")
-        print(f"Edges: {len(edges)}")
+        print(f"Nodes: {node_count}")
+        print(f"Edges: {edge_count}")
         print(f"Output: {output_path}")
         print()
 
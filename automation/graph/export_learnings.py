@@ -8,9 +8,24 @@ import sqlite3
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used otherwise
+    orjson = None
+
 DB_PATH = Path(__file__).parent.parent / "learning" / "data" / "memory.db"
 OUTPUT_PATH = Path(__file__).parent.parent / "web" / "data" / "learnings.json"
 
+def write_json(data):
+    """Write data to OUTPUT_PATH as indented JSON, using orjson when available."""
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode('utf-8')
+
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT_PATH.write_bytes(payload)
+
 def export_learnings():
     """Export learnings and interactions to JSON."""
 
@@ -71,8 +86,7 @@ def export_learnings():
     }
 
     # Write to file
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(json.dumps(export_data, indent=2), encoding='utf-8')
+    write_json(export_data)
 
     print(f"✅ Exported {len(interactions)} interactions and {len(learnings)} learnings")
     print(f"   Output: {OUTPUT_PATH}")
@@ -91,8 +105,7 @@ def create_empty_export():
         "learnings": []
     }
 
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(json.dumps(export_data, indent=2), encoding='utf-8')
+    write_json(export_data)
 
     print(f"✅ Created empty learnings.json at {OUTPUT_PATH}")
 
@@ -8,14 +8,53 @@ In production, could migrate to Neo4j or similar.
 
 import sqlite3
 import json
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used otherwise
+    orjson = None
+
+
+def _dumps(data: Any) -> str:
+    """Encode properties for the JSON text columns, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+
+def _loads(data: str) -> Any:
+    """Decode a JSON text column, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _node_factory(cursor: sqlite3.Cursor, row: Tuple) -> Dict[str, Any]:
+    """Row factory for ``id, type, properties[, ...]`` selects, returning node dicts."""
+    node = {"id": row[0], "type": row[1], "properties": _loads(row[2])}
+    for column, value in zip(cursor.description[3:], row[3:]):
+        node[column[0]] = value
+    return node
 
 
 class KnowledgeGraph:
     """Graph database for tracking relationships between documentation entities."""
 
+    # graph.db is committed to git by the tracking workflows, so it keeps the
+    # rollback journal: in WAL mode, writes not yet checkpointed would sit in
+    # the untracked -wal file. Setting it explicitly also converts a database
+    # that was switched to WAL earlier.
+    PRAGMAS = (
+        "PRAGMA journal_mode=DELETE",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
+    )
+
     def __init__(self, db_path: Optional[str] = None):
         if db_path is None:
             db_path = Path(__file__).parent / "data" / "graph.db"
@@ -23,13 +62,25 @@ class KnowledgeGraph:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(str(self.db_path))
+        # isolation_level=None: statements autocommit unless wrapped in an
+        # explicit bulk() transaction; prepared statements are cached per connection
+        self.conn = sqlite3.connect(
+            str(self.db_path),
+            cached_statements=512,
+            isolation_level=None
+        )
         self.conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            self.conn.execute(pragma)
         self._init_schema()
 
     def _init_schema(self):
         """Initialize graph schema."""
+        # executescript doesn't open a transaction itself in autocommit mode,
+        # so group the DDL explicitly to commit it once
         self.conn.executescript("""
+            BEGIN;
+
             -- Nodes table
             CREATE TABLE IF NOT EXISTS nodes (
                 id TEXT PRIMARY KEY,
@@ -54,11 +105,36 @@ class KnowledgeGraph:
 
             -- Indexes for performance
             CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type);
+            CREATE INDEX IF NOT EXISTS idx_nodes_type_created ON nodes(type, created_at);
             CREATE INDEX IF NOT EXISTS idx_edges_from ON edges(from_id);
             CREATE INDEX IF NOT EXISTS idx_edges_to ON edges(to_id);
             CREATE INDEX IF NOT EXISTS idx_edges_relationship ON edges(relationship);
+            CREATE INDEX IF NOT EXISTS idx_edges_rel_from ON edges(relationship, from_id);
+            CREATE INDEX IF NOT EXISTS idx_edges_rel_to ON edges(relationship, to_id);
+
+            COMMIT;
         """)
-        self.conn.commit()
+
+    @contextmanager
+    def bulk(self):
+        """
+        Run the enclosed writes in one explicit transaction.
+
+        Wrap batches of add_node/add_edge/update_node calls in
+        ``with graph.bulk():`` to pay for a single commit instead of one per call.
+        """
+        if self.conn.in_transaction:
+            # Already inside an outer transaction, let it commit
+            yield
+            return
+
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
 
     def add_node(self, node_type: str, node_id: str, **properties) -> str:
         """
@@ -77,48 +153,85 @@ class KnowledgeGraph:
         self.conn.execute("""
             INSERT OR REPLACE INTO nodes (id, type, properties, updated_at)
             VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-        """, (full_id, node_type, json.dumps(properties)))
+        """, (full_id, node_type, _dumps(properties)))
 
-        self.conn.commit()
         return full_id
 
+    def add_nodes_bulk(self, nodes: Iterable[Tuple[str, str, Dict[str, Any]]]) -> List[str]:
+        """
+        Add or update many nodes in a single transaction.
+
+        Args:
+            nodes: (node_type, node_id, properties) tuples
+
+        Returns:
+            The full node IDs, in input order
+        """
+        rows = [
+            (f"{node_type}:{node_id}", node_type, _dumps(properties))
+            for node_type, node_id, properties in nodes
+        ]
+
+        with self.bulk():
+            self.conn.executemany("""
+                INSERT OR REPLACE INTO nodes (id, type, properties, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, rows)
+
+        return [row[0] for row in rows]
+
+    def _node_cursor(self) -> sqlite3.Cursor:
+        """Cursor whose rows come back as node dicts (see _node_factory)."""
+        cursor = self.conn.cursor()
+        cursor.row_factory = _node_factory
+        return cursor
+
     def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
         """Get a node by ID."""
-        cursor = self.conn.execute(
-            "SELECT * FROM nodes WHERE id = ?",
+        cursor = self._node_cursor().execute(
+            "SELECT id, type, properties, created_at, updated_at FROM nodes WHERE id = ?",
             (node_id,)
         )
-        row = cursor.fetchone()
-
-        if row is None:
-            return None
-
-        return {
-            "id": row["id"],
-            "type": row["type"],
-            "properties": json.loads(row["properties"]),
-            "created_at": row["created_at"],
-            "updated_at": row["updated_at"]
-        }
+        return cursor.fetchone()
 
     def update_node(self, node_id: str, **properties) -> bool:
         """Update node properties. Returns False if node doesn't exist."""
-        node = self.get_node(node_id)
-        if node is None:
-            print(f"⚠️ Node not found: {node_id} (skipping update)")
-            return False
-
-        # Merge properties
-        current_props = node["properties"]
-        current_props.update(properties)
-
-        self.conn.execute("""
+        # SQLite's JSON path labels can't escape '"' or '\\', so merge such
+        # keys in Python instead
+        if any('"' in key or '\\' in key for key in properties):
+            node = self.get_node(node_id)
+            if node is None:
+                print(f"⚠️ Node not found: {node_id} (skipping update)")
+                return False
+
+            current_props = node["properties"]
+            current_props.update(properties)
+            self.conn.execute("""
+                UPDATE nodes
+                SET properties = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (_dumps(current_props), node_id))
+            return True
+
+        # Merge properties inside SQLite: json_set overwrites each top-level
+        # key like dict.update, unlike json_patch which merges nested objects
+        # and drops keys set to None
+        assignments = "".join(", ?, json(?)" for _ in properties)
+        params = []
+        for key, value in properties.items():
+            params.extend((f'$."{key}"', _dumps(value)))
+
+        cursor = self.conn.execute(f"""
             UPDATE nodes
-            SET properties = ?, updated_at = CURRENT_TIMESTAMP
+            SET properties = json_set(properties{assignments}),
+                updated_at = CURRENT_TIMESTAMP
             WHERE id = ?
-        """, (json.dumps(current_props), node_id))
+        """, (*params, node_id))
+
+        if cursor.rowcount == 0:
+            print(f"⚠️ Node not found: {node_id} (skipping update)")
+            return False
 
-        self.conn.commit()
         return True
 
     def add_edge(self, from_id: str, to_id: str, relationship: str, **properties):
@@ -134,39 +247,47 @@ class KnowledgeGraph:
         self.conn.execute("""
             INSERT OR IGNORE INTO edges (from_id, to_id, relationship, properties)
             VALUES (?, ?, ?, ?)
-        """, (from_id, to_id, relationship, json.dumps(properties)))
+        """, (from_id, to_id, relationship, _dumps(properties)))
+
+    def add_edges_bulk(self, edges: Iterable[Tuple[str, str, str, Dict[str, Any]]]):
+        """
+        Add many relationships in a single transaction.
+
+        Args:
+            edges: (from_id, to_id, relationship, properties) tuples
+        """
+        rows = [
+            (from_id, to_id, relationship, _dumps(properties))
+            for from_id, to_id, relationship, properties in edges
+        ]
 
-        self.conn.commit()
+        with self.bulk():
+            self.conn.executemany("""
+                INSERT OR IGNORE INTO edges (from_id, to_id, relationship, properties)
+                VALUES (?, ?, ?, ?)
+            """, rows)
 
     def find_related(self, node_id: str, relationship: Optional[str] = None) -> List[Dict]:
         """Find all nodes related to this node."""
+        # One leg per edge direction so each can use its own index; the
+        # second leg skips self-loops already returned by the first
+        rel_filter = "AND e.relationship = ?" if relationship else ""
+        query = f"""
+            SELECT n.id, n.type, n.properties FROM edges e
+            JOIN nodes n ON n.id IN (e.from_id, e.to_id)
+            WHERE e.from_id = ? {rel_filter}
+            UNION ALL
+            SELECT n.id, n.type, n.properties FROM edges e
+            JOIN nodes n ON n.id IN (e.from_id, e.to_id)
+            WHERE e.to_id = ? AND e.from_id != ? {rel_filter}
+        """
+
         if relationship:
-            query = """
-                SELECT n.* FROM nodes n
-                JOIN edges e ON (e.to_id = n.id OR e.from_id = n.id)
-                WHERE (e.from_id = ? OR e.to_id = ?)
-                  AND e.relationship = ?
-            """
-            params = (node_id, node_id, relationship)
+            params = (node_id, relationship, node_id, node_id, relationship)
         else:
-            query = """
-                SELECT n.* FROM nodes n
-                JOIN edges e ON (e.to_id = n.id OR e.from_id = n.id)
-                WHERE (e.from_id = ? OR e.to_id = ?)
-            """
-            params = (node_id, node_id)
+            params = (node_id, node_id, node_id)
 
-        cursor = self.conn.execute(query, params)
-
-        results = []
-        for row in cursor:
-            results.append({
-                "id": row["id"],
-                "type": row["type"],
-                "properties": json.loads(row["properties"])
-            })
-
-        return results
+        return self._node_cursor().execute(query, params).fetchall()
 
     def find_dependents(self, node_id: str, max_depth: int = 3) -> List[str]:
         """
@@ -174,48 +295,34 @@ class KnowledgeGraph:
 
         Example: If a Document changes, find all Skills that include it.
         """
-        visited = set()
-        to_visit = [(node_id, 0)]
-        dependents = []
-
-        while to_visit:
-            current_id, depth = to_visit.pop(0)
-
-            if current_id in visited or depth >= max_depth:
-                continue
+        if max_depth < 1:
+            return []
 
-            visited.add(current_id)
-
-            # Find outgoing edges (nodes that depend on this one)
-            cursor = self.conn.execute("""
-                SELECT to_id FROM edges WHERE from_id = ?
-            """, (current_id,))
-
-            for row in cursor:
-                dependent_id = row["to_id"]
-                if dependent_id not in visited:
-                    dependents.append(dependent_id)
-                    to_visit.append((dependent_id, depth + 1))
-
-        return dependents
+        # Walk outgoing edges (nodes that depend on this one) in a single
+        # recursive query, nearest dependents first
+        cursor = self.conn.execute("""
+            WITH RECURSIVE deps(id, depth) AS (
+                SELECT to_id, 1 FROM edges WHERE from_id = ?
+                UNION
+                SELECT e.to_id, d.depth + 1
+                FROM edges e JOIN deps d ON e.from_id = d.id
+                WHERE d.depth < ?
+            )
+            SELECT id FROM deps
+            WHERE id != ?
+            GROUP BY id
+            ORDER BY MIN(depth), id
+        """, (node_id, max_depth, node_id))
+
+        return [row[0] for row in cursor]
 
     def query_by_type(self, node_type: str) -> List[Dict]:
         """Get all nodes of a specific type."""
-        cursor = self.conn.execute(
-            "SELECT * FROM nodes WHERE type = ? ORDER BY created_at DESC",
+        cursor = self._node_cursor().execute(
+            "SELECT id, type, properties, created_at FROM nodes WHERE type = ? ORDER BY created_at DESC",
             (node_type,)
         )
-
-        results = []
-        for row in cursor:
-            results.append({
-                "id": row["id"],
-                "type": row["type"],
-                "properties": json.loads(row["properties"]),
-                "created_at": row["created_at"]
-            })
-
-        return results
+        return cursor.fetchall()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get graph statistics."""
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """Analyze interactions to identify knowledge gaps."""
-import sqlite3
 import json
 import os
 from pathlib import Path
 
+from db import get_conn
+
 DB_PATH = Path(__file__).parent / "data" / "memory.db"
 
 def analyze_interaction(interaction_id):
@@ -21,21 +22,19 @@ def analyze_interaction(interaction_id):
 
 def store_learning(interaction_id, analysis):
     """Store identified learning."""
-    conn = sqlite3.connect(DB_PATH)
-
-    conn.execute(
-        """INSERT INTO learnings (interaction_id, concept, gap_type, proposed_fix, status)
-           VALUES (?, ?, ?, ?, 'pending')""",
-        (interaction_id, analysis["concept"], analysis["gap_type"], analysis["proposed_fix"])
-    )
-
-    conn.execute(
-        "UPDATE interactions SET identified_gap = 1 WHERE id = ?",
-        (interaction_id,)
-    )
-
-    conn.commit()
-    conn.close()
+    conn = get_conn(DB_PATH)
+
+    with conn:
+        conn.execute(
+            """INSERT INTO learnings (interaction_id, concept, gap_type, proposed_fix, status)
+               VALUES (?, ?, ?, ?, 'pending')""",
+            (interaction_id, analysis["concept"], analysis["gap_type"], analysis["proposed_fix"])
+        )
+
+        conn.execute(
+            "UPDATE interactions SET identified_gap = 1 WHERE id = ?",
+            (interaction_id,)
+        )
 
 if __name__ == "__main__":
     import argparse
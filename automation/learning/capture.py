@@ -1,18 +1,19 @@
 #!/usr/bin/env python3
 """Capture learning interactions from Claude Code usage."""
-import sqlite3
 import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from db import get_conn
+
 DB_PATH = Path(__file__).parent / "data" / "memory.db"
 
 def init_db():
     """Initialize learning database."""
     DB_PATH.parent.mkdir(exist_ok=True)
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn(DB_PATH)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS interactions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -40,23 +41,48 @@ def init_db():
     """)
 
     conn.commit()
-    conn.close()
 
 def capture_interaction(context, response, feedback=None):
     """Store an interaction."""
     init_db()
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn(DB_PATH)
 
-    cursor = conn.execute(
-        "INSERT INTO interactions (timestamp, user_context, agent_response, user_feedback) VALUES (?, ?, ?, ?)",
-        (datetime.utcnow().isoformat(), context, response, feedback)
-    )
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO interactions (timestamp, user_context, agent_response, user_feedback) VALUES (?, ?, ?, ?)",
+            (datetime.utcnow().isoformat(), context, response, feedback)
+        )
 
-    interaction_id = cursor.lastrowid
-    conn.commit()
-    conn.close()
+    return cursor.lastrowid
+
+def capture_interactions_bulk(interactions):
+    """Store many interactions in a single transaction.
+
+    Args:
+        interactions: Iterable of (context, response, feedback) tuples,
+            optionally followed by the interaction's ISO timestamp; items
+            without one are stamped as they are read, keeping their order
+
+    Returns:
+        Number of stored interactions
+    """
+    init_db()
+    conn = get_conn(DB_PATH)
+
+    rows = []
+    for context, response, feedback, *timestamp in interactions:
+        rows.append((
+            timestamp[0] if timestamp else datetime.utcnow().isoformat(),
+            context, response, feedback
+        ))
+
+    with conn:
+        conn.executemany(
+            "INSERT INTO interactions (timestamp, user_context, agent_response, user_feedback) VALUES (?, ?, ?, ?)",
+            rows
+        )
 
-    return interaction_id
+    return len(rows)
 
 if __name__ == "__main__":
     # CLI interface for hook
@@ -0,0 +1,40 @@
+"""SQLite connection helper shared by the learning scripts."""
+import atexit
+import sqlite3
+from pathlib import Path
+
+DB_PATH = Path(__file__).parent / "data" / "memory.db"
+
+# WAL lets readers run alongside a writer and, together with
+# synchronous=NORMAL, avoids a full fsync on every commit
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+)
+
+_connections = {}
+
+def connect(db_path=DB_PATH):
+    """Open a connection to the learning database with tuned PRAGMAs."""
+    conn = sqlite3.connect(db_path)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def get_conn(db_path=DB_PATH):
+    """Return the process-wide connection to db_path, opening it on first use."""
+    key = str(db_path)
+    conn = _connections.get(key)
+    if conn is None:
+        conn = _connections[key] = connect(db_path)
+    return conn
+
+@atexit.register
+def close_all():
+    """Close all shared connections."""
+    while _connections:
+        _, conn = _connections.popitem()
+        conn.close()
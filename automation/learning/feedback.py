@@ -1,19 +1,19 @@
 #!/usr/bin/env python3
 """Track user satisfaction."""
-import sqlite3
 from pathlib import Path
 
+from db import get_conn
+
 DB_PATH = Path(__file__).parent / "data" / "memory.db"
 
 def add_feedback(interaction_id, rating, comment=None):
     """Add user feedback to interaction."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(
-        "UPDATE interactions SET user_feedback = ? WHERE id = ?",
-        (f"Rating: {rating}/5. {comment or ''}", interaction_id)
-    )
-    conn.commit()
-    conn.close()
+    conn = get_conn(DB_PATH)
+    with conn:
+        conn.execute(
+            "UPDATE interactions SET user_feedback = ? WHERE id = ?",
+            (f"Rating: {rating}/5. {comment or ''}", interaction_id)
+        )
 
 if __name__ == "__main__":
     import argparse
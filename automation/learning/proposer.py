@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 """Propose documentation updates from learnings."""
-import sqlite3
 from pathlib import Path
 
+from db import get_conn
+
 DB_PATH = Path(__file__).parent / "data" / "memory.db"
 
 def get_pending_learnings():
     """Get learnings that need issues."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = get_conn(DB_PATH)
     cursor = conn.execute(
         """SELECT l.id, l.concept, l.gap_type, l.proposed_fix, i.user_context
            FROM learnings l
@@ -15,21 +16,17 @@ def get_pending_learnings():
            WHERE l.status = 'pending'"""
     )
 
-    learnings = cursor.fetchall()
-    conn.close()
-
-    return learnings
+    return cursor.fetchall()
 
 def create_issue_for_learning(learning_id, issue_number):
     """Mark learning as issued."""
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(
-        """UPDATE learnings SET status = 'issued' WHERE id = ?""",
-        (learning_id,)
-    )
-    # TODO: Link to GitHub issue
-    conn.commit()
-    conn.close()
+    conn = get_conn(DB_PATH)
+    with conn:
+        conn.execute(
+            """UPDATE learnings SET status = 'issued' WHERE id = ?""",
+            (learning_id,)
+        )
+        # TODO: Link to GitHub issue
 
 if __name__ == "__main__":
     learnings = get_pending_learnings()
@@ -8,8 +8,10 @@ Usage:
 
 import argparse
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import TextIO
 
 
 class ClaudeSkillGenerator:
@@ -36,9 +38,15 @@ class ClaudeSkillGenerator:
         if not md_files:
             raise ValueError(f"No .md files found in {docs_path}")
 
-        for md_file in md_files:
+        # Reads are I/O-bound, so overlap them; map() keeps the sorted order
+        with ThreadPoolExecutor(max_workers=min(32, len(md_files))) as executor:
+            texts = list(executor.map(
+                lambda md_file: md_file.read_text(encoding='utf-8'),
+                md_files
+            ))
+
+        for md_file, section_content in zip(md_files, texts):
             print(f"  📄 Processing: {md_file.name}")
-            section_content = md_file.read_text(encoding='utf-8')
 
             content['sections'].append({
                 'filename': md_file.name,
@@ -48,60 +56,61 @@ class ClaudeSkillGenerator:
         print(f"✓ Processed {len(md_files)} documentation files")
         return content
 
-    def generate_skill(self, content: dict) -> str:
-        """Generate SKILL.md from parsed content."""
+    def generate_skill(self, content: dict, out: TextIO):
+        """Write SKILL.md for parsed content to an open text file."""
         print("🔨 Generating Claude SKILL.md...")
 
-        # Build SKILL.md
-        skill = []
+        # Write line by line instead of joining the whole document in memory
+        def line(text: str = ""):
+            out.write(text)
+            out.write('\n')
 
         # Header
-        skill.append("# Keboola Platform Knowledge for Claude Code")
-        skill.append("")
-        skill.append("> **⚠️ POC NOTICE**: This skill was automatically generated from documentation.")
-        skill.append("> Source: `docs/keboola/`")
-        skill.append("> Generator: `scripts/generators/claude_generator.py`")
-        skill.append(f"> Generated: {content['metadata']['generated_at']}")
-        skill.append("")
-        skill.append("---")
-        skill.append("")
+        line("# Keboola Platform Knowledge for Claude Code")
+        line()
+        line("> **⚠️ POC NOTICE**: This skill was automatically generated from documentation.")
+        line("> Source: `docs/keboola/`")
+        line("> Generator: `scripts/generators/claude_generator.py`")
+        line(f"> Generated: {content['metadata']['generated_at']}")
+        line()
+        line("---")
+        line()
 
         # Introduction
-        skill.append("## Overview")
-        skill.append("")
-        skill.append("This skill provides comprehensive knowledge about the Keboola platform,")
-        skill.append("including API usage, best practices, and common pitfalls.")
-        skill.append("")
-        skill.append("**When to activate this skill:**")
-        skill.append("- User asks about Keboola Storage API")
-        skill.append("- User needs help with Keboola Jobs API")
-        skill.append("- User asks about regional stacks or Stack URLs")
-        skill.append("- User encounters Keboola-related errors")
-        skill.append("")
-        skill.append("---")
-        skill.append("")
+        line("## Overview")
+        line()
+        line("This skill provides comprehensive knowledge about the Keboola platform,")
+        line("including API usage, best practices, and common pitfalls.")
+        line()
+        line("**When to activate this skill:**")
+        line("- User asks about Keboola Storage API")
+        line("- User needs help with Keboola Jobs API")
+        line("- User asks about regional stacks or Stack URLs")
+        line("- User encounters Keboola-related errors")
+        line()
+        line("---")
+        line()
 
         # Add all sections
         for section in content['sections']:
-            skill.append(f"<!-- Source: {section['filename']} -->")
-            skill.append("")
-            skill.append(section['content'])
-            skill.append("")
-            skill.append("---")
-            skill.append("")
+            line(f"<!-- Source: {section['filename']} -->")
+            line()
+            line(section['content'])
+            line()
+            line("---")
+            line()
 
         # Footer
-        skill.append("## Metadata")
-        skill.append("")
-        skill.append("```json")
-        skill.append(json.dumps(content['metadata'], indent=2))
-        skill.append("```")
-        skill.append("")
-        skill.append("---")
-        skill.append("")
-        skill.append("**End of Skill**")
-
-        return '\n'.join(skill)
+        line("## Metadata")
+        line()
+        line("```json")
+        json.dump(content['metadata'], out, indent=2)
+        line()
+        line("```")
+        line()
+        line("---")
+        line()
+        out.write("**End of Skill**")
 
     def generate(self, docs_path: Path, output_path: Path):
         """Main generation process."""
@@ -113,15 +122,13 @@ class ClaudeSkillGenerator:
         # Parse documentation
         content = self.parse_docs(docs_path)
 
-        # Generate skill
-        skill_content = self.generate_skill(content)
-
-        # Write output
+        # Generate skill straight into the output file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(skill_content, encoding='utf-8')
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            self.generate_skill(content, f)
 
         print(f"✓ Generated: {output_path}")
-        print(f"  Size: {len(skill_content)} characters")
+        print(f"  Size: {output_path.stat().st_size} bytes")
         print(f"  Sections: {len(content['sections'])}")
 
         # Write metadata
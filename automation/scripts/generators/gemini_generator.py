@@ -8,6 +8,7 @@ Usage:
 
 import argparse
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -36,9 +37,15 @@ class GeminiSkillGenerator:
         if not md_files:
             raise ValueError(f"No .md files found in {docs_path}")
 
-        for md_file in md_files:
+        # Reads are I/O-bound, so overlap them; map() keeps the sorted order
+        with ThreadPoolExecutor(max_workers=min(32, len(md_files))) as executor:
+            contents = list(executor.map(
+                lambda md_file: md_file.read_text(encoding='utf-8'),
+                md_files
+            ))
+
+        for md_file, content in zip(md_files, contents):
             print(f"  📄 Processing: {md_file.name}")
-            content = md_file.read_text(encoding='utf-8')
 
             skill['knowledge_base'].append({
                 'source': md_file.name,
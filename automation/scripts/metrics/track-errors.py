@@ -15,12 +15,121 @@ Usage:
 
 import argparse
 import json
-import csv
+import itertools
 import os
+import statistics
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, stdlib json is used otherwise
+    orjson = None
+
+# Parsed timestamps keyed by their raw ISO string; error logs repeat the
+# same timestamps a lot, so each distinct value is only parsed once
+_ISO_CACHE: Dict[str, datetime] = {}
+
+
+def _looks_iso(value: Any) -> bool:
+    """Cheap pre-check so obviously malformed timestamps skip the try/except."""
+    return isinstance(value, str) and value[:1].isdigit()
+
+
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO-8601 timestamp (with optional 'Z' suffix), memoized."""
+    dt = _ISO_CACHE.get(timestamp)
+    if dt is None:
+        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        _ISO_CACHE[timestamp] = dt
+    return dt
+
+
+def _format_hours(hours: Optional[float]) -> str:
+    """Format a resolution time for CSV output, blank when unknown."""
+    return f"{hours:.2f}" if hours is not None else ""
+
+
+def _resolution_hours(error: Dict[str, Any]) -> Optional[float]:
+    """Hours from report to resolution of a resolved error, None when unknown."""
+    if error.get("status", "open") != "resolved":
+        return None
+
+    resolved_at = error.get("resolved_at")
+    reported_at = error.get("reported_at", error.get("timestamp"))
+    if not (_looks_iso(resolved_at) and _looks_iso(reported_at)):
+        return None
+
+    try:
+        return (_parse_iso(resolved_at) - _parse_iso(reported_at)).total_seconds() / 3600
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class ErrorRecord:
+    """
+    A simulated error, stored with __slots__ instead of a per-error dict.
+
+    get() mirrors dict.get (unset fields count as missing), so records and
+    errors loaded from a log go through the same processing and export code.
+    """
+
+    id: str
+    type: str
+    severity: str
+    category: str
+    status: str
+    reported_at: str
+    message: str
+    resolved_at: Optional[str] = None
+    # Derived by ErrorTracker._process_errors, not part of the exported record
+    resolution_hours: Optional[float] = field(
+        default=None, compare=False, metadata={"export": False}
+    )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record as a dict, leaving out unset and derived fields."""
+        return {
+            f.name: value for f in fields(self)
+            if f.metadata.get("export", True)
+            and (value := getattr(self, f.name)) is not None
+        }
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize ErrorRecord values in JSON output."""
+    if isinstance(obj, ErrorRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any, compact: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON (indented unless compact), using orjson when available."""
+    if orjson is not None:
+        # Route dataclasses through _json_default so unset fields are omitted
+        option = orjson.OPT_PASSTHROUGH_DATACLASS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_json_default, option=option)
+    if compact:
+        return json.dumps(data, default=_json_default, separators=(',', ':')).encode('utf-8')
+    return json.dumps(data, default=_json_default, indent=2).encode('utf-8')
 
 
 class ErrorTracker:
@@ -32,14 +141,19 @@ class ErrorTracker:
 
         self.errors = []
         self.stats = {
-            "by_type": defaultdict(int),
-            "by_severity": defaultdict(int),
-            "by_status": defaultdict(int),
-            "by_category": defaultdict(int),
+            "by_type": Counter(),
+            "by_severity": Counter(),
+            "by_status": Counter(),
+            "by_category": Counter(),
             "daily_errors": defaultdict(int),
             "resolution_times": [],
         }
 
+        # Earliest/latest report time, filled in by _process_errors so later
+        # passes don't re-parse timestamps
+        self.first_error_at: Optional[datetime] = None
+        self.last_error_at: Optional[datetime] = None
+
     def load_error_log(self, log_file: str) -> None:
         """Load errors from JSON log file."""
         print(f"Loading error log: {log_file}")
@@ -48,63 +162,89 @@ class ErrorTracker:
             print(f"Warning: Error log not found: {log_file}")
             return
 
-        with open(log_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(log_file, 'rb') as f:
+            data = _loads(f.read())
 
         if isinstance(data, list):
-            self.errors = data
+            new_errors = data
         elif isinstance(data, dict) and "errors" in data:
-            self.errors = data["errors"]
+            new_errors = data["errors"]
         else:
             print("Warning: Unexpected error log format")
             return
 
-        print(f"Loaded {len(self.errors)} errors")
-        self._process_errors()
-
-    def _process_errors(self) -> None:
-        """Process loaded errors and calculate statistics."""
-        for error in self.errors:
-            # Count by type
-            error_type = error.get("type", "unknown")
-            self.stats["by_type"][error_type] += 1
-
-            # Count by severity
-            severity = error.get("severity", "unknown")
-            self.stats["by_severity"][severity] += 1
-
-            # Count by status
-            status = error.get("status", "open")
-            self.stats["by_status"][status] += 1
-
-            # Count by category
-            category = error.get("category", "uncategorized")
-            self.stats["by_category"][category] += 1
+        self.errors.extend(new_errors)
+
+        print(f"Loaded {len(new_errors)} errors")
+        self._process_errors(new_errors)
+
+    def _process_errors(self, new_errors: List[Dict[str, Any]]) -> None:
+        """
+        Add newly collected errors to the running statistics.
+
+        Only the given errors are counted, so loading or simulating more data
+        later doesn't count earlier errors twice.
+        """
+        # Bind counters and helpers to locals for the per-error loop
+        stats = self.stats
+        by_type = stats["by_type"]
+        by_severity = stats["by_severity"]
+        by_status = stats["by_status"]
+        by_category = stats["by_category"]
+        daily_errors = stats["daily_errors"]
+        add_resolution_time = stats["resolution_times"].append
+        first_error_at = self.first_error_at
+        last_error_at = self.last_error_at
+        looks_iso = _looks_iso
+        parse_iso = _parse_iso
+
+        for error in new_errors:
+            get = error.get
+
+            # Count by type, severity, status and category
+            by_type[get("type", "unknown")] += 1
+            by_severity[get("severity", "unknown")] += 1
+            status = get("status", "open")
+            by_status[status] += 1
+            by_category[get("category", "uncategorized")] += 1
 
             # Daily errors
-            timestamp = error.get("timestamp", error.get("reported_at"))
-            if timestamp:
+            timestamp = get("timestamp", get("reported_at"))
+            if looks_iso(timestamp):
                 try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    date_key = dt.strftime('%Y-%m-%d')
-                    self.stats["daily_errors"][date_key] += 1
-                except (ValueError, AttributeError):
+                    dt = parse_iso(timestamp)
+                    # Extended ISO strings already start with the date key
+                    if timestamp[4:5] == '-' and timestamp[7:8] == '-':
+                        daily_errors[timestamp[:10]] += 1
+                    else:
+                        daily_errors[dt.date().isoformat()] += 1
+                except ValueError:
                     pass
+                else:
+                    if first_error_at is None or dt < first_error_at:
+                        first_error_at = dt
+                    if last_error_at is None or dt > last_error_at:
+                        last_error_at = dt
 
             # Resolution time
-            if error.get("status") == "resolved":
-                resolved_at = error.get("resolved_at")
-                reported_at = error.get("reported_at", error.get("timestamp"))
+            if status == "resolved":
+                resolved_at = get("resolved_at")
+                reported_at = get("reported_at", get("timestamp"))
 
-                if resolved_at and reported_at:
+                if looks_iso(resolved_at) and looks_iso(reported_at):
                     try:
-                        resolved_dt = datetime.fromisoformat(resolved_at.replace('Z', '+00:00'))
-                        reported_dt = datetime.fromisoformat(reported_at.replace('Z', '+00:00'))
+                        resolved_dt = parse_iso(resolved_at)
+                        reported_dt = parse_iso(reported_at)
                         resolution_time = (resolved_dt - reported_dt).total_seconds() / 3600  # hours
-                        self.stats["resolution_times"].append(resolution_time)
-                    except (ValueError, AttributeError):
+                        add_resolution_time(resolution_time)
+                        if isinstance(error, ErrorRecord):
+                            error.resolution_hours = resolution_time
+                    except ValueError:
                         pass
 
+        self.first_error_at = first_error_at
+        self.last_error_at = last_error_at
+
     def simulate_data(self, days: int = 30, errors_per_day: int = 5) -> None:
         """Generate simulated error data for testing."""
         print(f"Generating simulated error data for {days} days")
@@ -119,79 +259,98 @@ class ErrorTracker:
 
         severities = ["critical", "high", "medium", "low"]
         severity_weights = [5, 15, 40, 40]  # Most errors are low/medium
+        severity_cum_weights = list(itertools.accumulate(severity_weights))
+
+        # Most errors get resolved
+        statuses = ["resolved", "open", "investigating"]
+        status_cum_weights = list(itertools.accumulate([70, 20, 10]))
 
         categories = [
             "configuration", "validation", "api", "database",
             "file-handling", "network", "auth", "data-processing"
         ]
 
-        start_date = datetime.now() - timedelta(days=days)
+        # Resolution time range in hours depends on severity
+        resolution_ranges = {
+            "critical": (0.5, 4),
+            "high": (2, 12),
+            "medium": (4, 48),
+            "low": (12, 168),  # up to a week
+        }
 
-        for day in range(days):
-            current_date = start_date + timedelta(days=day)
+        first_new = len(self.errors)
 
-            # Fewer errors on weekends
-            is_weekend = current_date.weekday() >= 5
-            daily_count = random.randint(1, errors_per_day // 2) if is_weekend else random.randint(2, errors_per_day)
+        start_date = datetime.now() - timedelta(days=days)
+        dates = [start_date + timedelta(days=day) for day in range(days)]
 
-            for _ in range(daily_count):
+        # Fewer errors on weekends
+        daily_counts = [
+            random.randint(1, errors_per_day // 2) if date.weekday() >= 5 else random.randint(2, errors_per_day)
+            for date in dates
+        ]
+        total = sum(daily_counts)
+
+        # Draw the random attributes for every error up front, one call per
+        # attribute, instead of several random.* calls per error
+        draws = zip(
+            random.choices(range(8, 21), k=total),  # hour
+            random.choices(range(60), k=total),  # minute
+            random.choices(severities, cum_weights=severity_cum_weights, k=total),
+            random.choices(error_types, k=total),
+            random.choices(categories, k=total),
+            random.choices(statuses, cum_weights=status_cum_weights, k=total),
+        )
+
+        # Bind helpers to locals for the per-error loop
+        add_error = self.errors.append
+        uniform = random.uniform
+        islice = itertools.islice
+        next_id = first_new + 1
+
+        for current_date, daily_count in zip(dates, daily_counts):
+            for hour, minute, severity, error_type, category, status in islice(draws, daily_count):
                 # Random time during the day
-                hour = random.randint(8, 20)
-                minute = random.randint(0, 59)
                 error_time = current_date.replace(hour=hour, minute=minute)
 
-                severity = random.choices(severities, weights=severity_weights)[0]
-                error_type = random.choice(error_types)
-                category = random.choice(categories)
-
-                # Most errors get resolved
-                status = random.choices(["resolved", "open", "investigating"], weights=[70, 20, 10])[0]
-
-                error = {
-                    "id": f"error-{len(self.errors) + 1}",
-                    "type": error_type,
-                    "severity": severity,
-                    "category": category,
-                    "status": status,
-                    "reported_at": error_time.isoformat(),
-                    "message": f"Simulated {error_type} in {category}",
-                }
-
                 # Add resolution time for resolved errors
+                resolved_at = None
                 if status == "resolved":
-                    # Resolution time depends on severity
-                    if severity == "critical":
-                        hours = random.uniform(0.5, 4)
-                    elif severity == "high":
-                        hours = random.uniform(2, 12)
-                    elif severity == "medium":
-                        hours = random.uniform(4, 48)
-                    else:
-                        hours = random.uniform(12, 168)  # up to a week
-
+                    hours = uniform(*resolution_ranges[severity])
                     resolved_time = error_time + timedelta(hours=hours)
-                    error["resolved_at"] = resolved_time.isoformat()
+                    resolved_at = resolved_time.isoformat()
+
+                add_error(ErrorRecord(
+                    id=f"error-{next_id}",
+                    type=error_type,
+                    severity=severity,
+                    category=category,
+                    status=status,
+                    reported_at=error_time.isoformat(),
+                    message=f"Simulated {error_type} in {category}",
+                    resolved_at=resolved_at
+                ))
+                next_id += 1
 
-                self.errors.append(error)
+        new_errors = self.errors[first_new:]
 
-        print(f"Generated {len(self.errors)} simulated errors")
-        self._process_errors()
+        print(f"Generated {len(new_errors)} simulated errors")
+        self._process_errors(new_errors)
 
     def calculate_metrics(self) -> Dict[str, Any]:
         """Calculate summary metrics from collected error data."""
         metrics = {
             "total_errors": len(self.errors),
-            "by_type": dict(self.stats["by_type"]),
-            "by_severity": dict(self.stats["by_severity"]),
-            "by_status": dict(self.stats["by_status"]),
-            "by_category": dict(self.stats["by_category"]),
+            "by_type": self.stats["by_type"].copy(),
+            "by_severity": self.stats["by_severity"].copy(),
+            "by_status": self.stats["by_status"].copy(),
+            "by_category": self.stats["by_category"].copy(),
         }
 
         # Resolution statistics
         if self.stats["resolution_times"]:
             resolution_times = self.stats["resolution_times"]
             metrics["avg_resolution_time_hours"] = sum(resolution_times) / len(resolution_times)
-            metrics["median_resolution_time_hours"] = sorted(resolution_times)[len(resolution_times) // 2]
+            metrics["median_resolution_time_hours"] = statistics.median_high(resolution_times)
             metrics["min_resolution_time_hours"] = min(resolution_times)
             metrics["max_resolution_time_hours"] = max(resolution_times)
             metrics["total_resolved"] = len(resolution_times)
@@ -209,28 +368,12 @@ class ErrorTracker:
             metrics["resolution_rate"] = 0
 
         # Date range
-        if self.errors:
-            timestamps = []
-            for error in self.errors:
-                timestamp = error.get("timestamp", error.get("reported_at"))
-                if timestamp:
-                    try:
-                        dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        timestamps.append(dt)
-                    except (ValueError, AttributeError):
-                        pass
-
-            if timestamps:
-                timestamps.sort()
-                metrics["first_error"] = timestamps[0].isoformat()
-                metrics["last_error"] = timestamps[-1].isoformat()
-                metrics["date_range_days"] = (timestamps[-1] - timestamps[0]).days + 1
-                metrics["avg_errors_per_day"] = len(self.errors) / max(metrics["date_range_days"], 1)
-            else:
-                metrics["first_error"] = None
-                metrics["last_error"] = None
-                metrics["date_range_days"] = 0
-                metrics["avg_errors_per_day"] = 0
+        first_error_at, last_error_at = self.first_error_at, self.last_error_at
+        if self.errors and first_error_at is not None:
+            metrics["first_error"] = first_error_at.isoformat()
+            metrics["last_error"] = last_error_at.isoformat()
+            metrics["date_range_days"] = (last_error_at - first_error_at).days + 1
+            metrics["avg_errors_per_day"] = len(self.errors) / max(metrics["date_range_days"], 1)
         else:
             metrics["first_error"] = None
             metrics["last_error"] = None
@@ -264,8 +407,8 @@ class ErrorTracker:
 
         return metrics
 
-    def export_json(self, filename: str = "error-stats.json") -> str:
-        """Export error statistics to JSON format."""
+    def export_json(self, filename: str = "error-stats.json", compact: bool = False) -> str:
+        """Export error statistics to JSON format, without indentation if compact."""
         output_path = self.output_dir / filename
 
         export_data = {
@@ -275,96 +418,92 @@ class ErrorTracker:
             "errors": self.errors,
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2)
+        output_path.write_bytes(_dumps(export_data, compact=compact))
 
         print(f"Exported JSON to: {output_path}")
         return str(output_path)
 
-    def export_csv(self, filename: str = "error-stats.csv") -> str:
-        """Export error statistics to CSV format."""
-        output_path = self.output_dir / filename
+    @contextmanager
+    def _open_csv(self, filename: str) -> Iterator[Tuple[Path, Any]]:
+        """Open a CSV file in the output directory, yielding (path, csv writer)."""
+        import csv
 
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-
-            # Write header
-            writer.writerow(["Category", "Subcategory", "Count"])
-
-            # Write by type
-            for error_type, count in sorted(self.stats["by_type"].items(), key=lambda x: -x[1]):
-                writer.writerow(["Type", error_type, count])
-
-            # Write by severity
-            for severity, count in sorted(self.stats["by_severity"].items(), key=lambda x: -x[1]):
-                writer.writerow(["Severity", severity, count])
+        output_path = self.output_dir / filename
 
-            # Write by status
-            for status, count in sorted(self.stats["by_status"].items(), key=lambda x: -x[1]):
-                writer.writerow(["Status", status, count])
+        # Large buffer so rows reach the OS in few write() calls
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            yield output_path, csv.writer(f)
 
-            # Write by category
-            for category, count in sorted(self.stats["by_category"].items(), key=lambda x: -x[1]):
-                writer.writerow(["Category", category, count])
+    def export_csv(self, filename: str = "error-stats.csv") -> str:
+        """Export error statistics to CSV format."""
+        with self._open_csv(filename) as (output_path, writer):
+            # Header, then each breakdown ordered by count
+            rows = [("Category", "Subcategory", "Count")]
+            for label, key in (
+                ("Type", "by_type"),
+                ("Severity", "by_severity"),
+                ("Status", "by_status"),
+                ("Category", "by_category"),
+            ):
+                rows.extend((label, name, count) for name, count in self.stats[key].most_common())
+
+            writer.writerows(rows)
 
         print(f"Exported CSV to: {output_path}")
         return str(output_path)
 
     def export_daily_csv(self, filename: str = "daily-errors.csv") -> str:
         """Export daily error counts to CSV."""
-        output_path = self.output_dir / filename
-
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
+        with self._open_csv(filename) as (output_path, writer):
             writer.writerow(["Date", "Error Count"])
-
-            for date, count in sorted(self.stats["daily_errors"].items()):
-                writer.writerow([date, count])
+            writer.writerows(sorted(self.stats["daily_errors"].items()))
 
         print(f"Exported daily errors CSV to: {output_path}")
         return str(output_path)
 
     def export_errors_csv(self, filename: str = "errors-detail.csv") -> str:
         """Export detailed error list to CSV."""
-        output_path = self.output_dir / filename
-
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
+        with self._open_csv(filename) as (output_path, writer):
             writer.writerow([
                 "ID", "Type", "Severity", "Category", "Status",
                 "Reported At", "Resolved At", "Resolution Time (hours)", "Message"
             ])
-
-            for error in self.errors:
-                resolution_time = ""
-                if error.get("status") == "resolved" and error.get("resolved_at") and error.get("reported_at"):
-                    try:
-                        resolved_dt = datetime.fromisoformat(error["resolved_at"].replace('Z', '+00:00'))
-                        reported_dt = datetime.fromisoformat(error["reported_at"].replace('Z', '+00:00'))
-                        hours = (resolved_dt - reported_dt).total_seconds() / 3600
-                        resolution_time = f"{hours:.2f}"
-                    except (ValueError, AttributeError):
-                        pass
-
-                writer.writerow([
-                    error.get("id", ""),
-                    error.get("type", ""),
-                    error.get("severity", ""),
-                    error.get("category", ""),
-                    error.get("status", ""),
-                    error.get("reported_at", ""),
-                    error.get("resolved_at", ""),
-                    resolution_time,
-                    error.get("message", "")[:100]  # Truncate long messages
-                ])
+            writer.writerows(self._error_rows())
 
         print(f"Exported detailed errors CSV to: {output_path}")
         return str(output_path)
 
+    def _error_rows(self) -> Iterator[Tuple]:
+        """Yield one detail CSV row per error."""
+        for error in self.errors:
+            get = error.get
+            # Records carry the hours computed by _process_errors; errors
+            # loaded from a log are plain dicts, and recomputing theirs only
+            # hits the parsed-timestamp cache
+            if isinstance(error, ErrorRecord):
+                hours = error.resolution_hours
+            else:
+                hours = _resolution_hours(error)
+            yield (
+                get("id", ""),
+                get("type", ""),
+                get("severity", ""),
+                get("category", ""),
+                get("status", ""),
+                get("reported_at", ""),
+                get("resolved_at", ""),
+                _format_hours(hours),
+                get("message", "")[:100]  # Truncate long messages
+            )
+
     def print_summary(self) -> None:
         """Print a human-readable summary of error statistics."""
         metrics = self.calculate_metrics()
 
+        # Percentage of all errors per unit count
+        total = metrics['total_errors']
+        pct = 100.0 / total if total else 0.0
+
         print("\n" + "=" * 60)
         print("ERROR STATISTICS SUMMARY")
         print("=" * 60)
@@ -382,14 +521,15 @@ class ErrorTracker:
 
         print(f"\n--- By Severity ---")
         severity_order = ["critical", "high", "medium", "low"]
+        by_severity = metrics['by_severity']
         for severity in severity_order:
-            count = metrics['by_severity'].get(severity, 0)
-            percentage = (count / metrics['total_errors'] * 100) if metrics['total_errors'] > 0 else 0
+            count = by_severity.get(severity, 0)
+            percentage = count * pct
             print(f"  {severity.capitalize():12} {count:4} ({percentage:5.1f}%)")
 
         print(f"\n--- By Status ---")
-        for status, count in sorted(metrics['by_status'].items(), key=lambda x: -x[1]):
-            percentage = (count / metrics['total_errors'] * 100) if metrics['total_errors'] > 0 else 0
+        for status, count in metrics['by_status'].most_common():
+            percentage = count * pct
             print(f"  {status.capitalize():12} {count:4} ({percentage:5.1f}%)")
 
         print(f"\n--- Resolution Metrics ---")
@@ -402,14 +542,13 @@ class ErrorTracker:
             print(f"Max Resolution Time: {metrics['max_resolution_time_hours']:.1f} hours")
 
         print(f"\n--- By Type (Top 10) ---")
-        sorted_types = sorted(metrics['by_type'].items(), key=lambda x: -x[1])[:10]
-        for error_type, count in sorted_types:
-            percentage = (count / metrics['total_errors'] * 100) if metrics['total_errors'] > 0 else 0
+        for error_type, count in metrics['by_type'].most_common(10):
+            percentage = count * pct
             print(f"  {error_type:30} {count:4} ({percentage:5.1f}%)")
 
         print(f"\n--- By Category ---")
-        for category, count in sorted(metrics['by_category'].items(), key=lambda x: -x[1]):
-            percentage = (count / metrics['total_errors'] * 100) if metrics['total_errors'] > 0 else 0
+        for category, count in metrics['by_category'].most_common():
+            percentage = count * pct
             print(f"  {category:30} {count:4} ({percentage:5.1f}%)")
 
         print("\n" + "=" * 60)
@@ -447,6 +586,11 @@ def main():
         default=5,
         help="Average errors per day for simulation (default: 5)"
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write error-stats.json without indentation (smaller, faster for large logs)"
+    )
 
     args = parser.parse_args()
 
@@ -466,10 +610,9 @@ def main():
 
     # Export data
     print("\nExporting data...")
-    tracker.export_json()
-    tracker.export_csv()
-    tracker.export_daily_csv()
-    tracker.export_errors_csv()
+    tracker.export_json(compact=args.compact)
+    for export_csv in (tracker.export_csv, tracker.export_daily_csv, tracker.export_errors_csv):
+        export_csv()
 
     print("\nDone!")
     return 0
@@ -20,6 +20,7 @@ Usage:
 
 import os
 import sys
+import gzip
 import json
 from pathlib import Path
 from flask import Flask, jsonify, request, Response
@@ -119,7 +120,13 @@ config_json_path = None
 @app.route('/')
 def index():
     """Serve the embedded HTML schema tester."""
-    return Response(HTML_CONTENT, mimetype='text/html')
+    if 'gzip' in request.accept_encodings:
+        response = Response(HTML_CONTENT_GZIP, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(HTML_CONTENT_BYTES, mimetype='text/html')
+    response.vary.add('Accept-Encoding')
+    return response
 
 
 @app.route('/api/discovery-info', methods=['GET'])
@@ -276,11 +283,12 @@ HTML_CONTENT = """<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Keboola Component Schema Tester</title>
+    <link rel="preconnect" href="https://cdn.jsdelivr.net">
+    <link rel="preload" href="https://cdn.jsdelivr.net/npm/@json-editor/json-editor@latest/dist/jsoneditor.min.js" as="script">
     <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css">
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@json-editor/json-editor@latest/dist/css/jsoneditor.min.css">
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/dist/css/select2.min.css">
-    <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/dist/js/select2.min.js"></script>
+    <!-- Editor styles aren't needed until the schemas have loaded, so don't block first paint on them -->
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@json-editor/json-editor@latest/dist/css/jsoneditor.min.css" media="print" onload="this.media='all'">
+    <noscript><link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@json-editor/json-editor@latest/dist/css/jsoneditor.min.css"></noscript>
     <script src="https://cdn.jsdelivr.net/npm/@json-editor/json-editor@latest/dist/jsoneditor.min.js"></script>
     <style>
         body {
@@ -437,6 +445,8 @@ HTML_CONTENT = """<!DOCTYPE html>
             border-radius: 4px;
             overflow-x: auto;
             max-height: 400px;
+            /* Keep re-rendered output from invalidating layout outside the pane */
+            contain: content;
         }
         .je-object__container {
             padding: 15px;
@@ -458,6 +468,18 @@ HTML_CONTENT = """<!DOCTYPE html>
             transform: translateY(-1px);
             box-shadow: 0 4px 8px rgba(27, 201, 142, 0.3);
         }
+        .btn-primary.sync-action-btn {
+            width: 100%;
+            margin-top: 10px;
+            padding: 12px;
+            font-size: 0.95rem;
+            background: #1BC98E;
+            border: none;
+            border-radius: 4px;
+            color: white;
+            cursor: pointer;
+            font-weight: 600;
+        }
         .btn-success {
             background: #0097A7;
             border: none;
@@ -711,39 +733,112 @@ HTML_CONTENT = """<!DOCTYPE html>
         </div> <!-- end content -->
     </div> <!-- end main-container -->
 
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js" defer></script>
     <script>
         let componentEditor, rowEditor;
 
-        // Store for debounce timers
-        const watchDebounceTimers = {};
+        // Editor host elements, kept here because they are detached from the
+        // document while an editor is being built
+        let componentHost, rowHost;
+
+        // Pending debounced option reloads, one per async field editor
+        const pendingReloads = new Map();
+
+        // Cancel pending option reloads, so none fire against editors that
+        // are about to be destroyed
+        function cancelPendingReloads() {
+            pendingReloads.forEach(timer => clearTimeout(timer));
+            pendingReloads.clear();
+        }
+
+        window.addEventListener('beforeunload', cancelPendingReloads);
+
+        // Per-editor reverse index of async-field watches: watched path ->
+        // reload callbacks of the fields depending on it, plus the last seen
+        // value of each watched path
+        const watchIndexes = new WeakMap();
+
+        // True while editors are filled programmatically; change handlers
+        // skip rendering outputs until the fill is complete
+        let building = false;
+
+        // Output panes ('component', 'row', 'combined') waiting to be
+        // re-rendered on the next animation frame
+        const dirtyOutputs = new Set();
+        let outputFrame = 0;
+
+        // The combined config is only stringified while its tab is shown
+        let combinedVisible = false;
+
+        // Coalesce output re-renders so each pane is stringified at most once
+        // per frame, however many 'change' events fire in between
+        function scheduleOutputs(...panes) {
+            panes.forEach(pane => dirtyOutputs.add(pane));
+            if (outputFrame) return;
+            outputFrame = requestAnimationFrame(() => {
+                outputFrame = 0;
+                if (dirtyOutputs.has('component')) updateComponentOutput();
+                if (dirtyOutputs.has('row')) updateRowOutput();
+                if (dirtyOutputs.has('combined')) updateCombinedOutput();
+                dirtyOutputs.clear();
+            });
+        }
+
+        // Last getValue() result per editor. A 'root' watch drops it on every
+        // edit, since JSONEditor notifies watchers synchronously while its
+        // 'change' event only fires on the next frame.
+        const valueCache = new WeakMap();
+
+        function cacheEditorValue(editor) {
+            editor.watch('root', () => valueCache.delete(editor));
+        }
+
+        // Current value of an editor, shared between callers until the next
+        // edit; treat it as read-only
+        function valueOf(editor) {
+            let value = valueCache.get(editor);
+            if (value === undefined) {
+                value = editor.getValue();
+                valueCache.set(editor, value);
+            }
+            return value;
+        }
 
         // ======================================
         // AUTO-LOAD ON PAGE LOAD
         // ======================================
 
-        // Load schemas from /api/schemas on page load
-        async function loadSchemas() {
+        // Load schemas from the pending /api/schemas request on page load.
+        // Resolves to true once the editors have been created.
+        async function loadSchemas(schemasRequest) {
             try {
-                const response = await fetch('/api/schemas');
+                const response = await schemasRequest;
                 if (!response.ok) {
                     throw new Error(`Failed to load schemas: ${response.statusText}`);
                 }
                 const data = await response.json();
+                await loadEditorDependencies(data.componentSchema, data.rowSchema);
                 initializeEditors(data.componentSchema, data.rowSchema);
 
                 showStatus('success', '✅ Schemas loaded successfully');
+                return true;
             } catch (error) {
                 console.error('Error loading schemas:', error);
                 showStatus('error', `❌ Error loading schemas: ${error.message}`);
+                return false;
             }
         }
 
-        // Load config from /api/config and pre-fill editors
-        async function loadConfig() {
+        // Load config from the pending /api/config request and pre-fill
+        // editors once they are ready
+        async function loadConfig(configRequest, schemasLoaded) {
             try {
-                const response = await fetch('/api/config');
-                const config = await response.json();
+                const [config, editorsCreated] = await Promise.all([
+                    configRequest.then(response => response.json()),
+                    schemasLoaded
+                ]);
+                if (!editorsCreated) return;
+                await editorsReady;
 
                 if (Object.keys(config).length > 0) {
                     splitAndFillConfig(config);
@@ -757,42 +852,80 @@ HTML_CONTENT = """<!DOCTYPE html>
             }
         }
 
+        // Which editor(s) each top-level config key belongs to, built when
+        // schemas load (from the original schemas, as the row editor may not
+        // have been built yet)
+        const COMPONENT_KEY = 1;
+        const ROW_KEY = 2;
+        let configKeyFlags = new Map();
+
+        function buildConfigKeyFlags(componentSchema, rowSchema) {
+            const flags = new Map();
+            for (const key of Object.keys(componentSchema.properties || {})) {
+                flags.set(key, COMPONENT_KEY);
+            }
+            for (const key of Object.keys(rowSchema.properties || {})) {
+                flags.set(key, (flags.get(key) || 0) | ROW_KEY);
+            }
+            return flags;
+        }
+
+        // Structural equality of two JSON values, ignoring key order
+        function jsonEqual(a, b) {
+            if (a === b) return true;
+            if (typeof a !== 'object' || typeof b !== 'object' || a === null || b === null) return false;
+            if (Array.isArray(a) !== Array.isArray(b)) return false;
+            const keys = Object.keys(a);
+            if (keys.length !== Object.keys(b).length) return false;
+            return keys.every(key => Object.hasOwn(b, key) && jsonEqual(a[key], b[key]));
+        }
+
         // Split combined config into component and row parts
         function splitAndFillConfig(config) {
-            if (!componentEditor || !rowEditor) {
+            if (!componentEditor) {
                 console.warn('Editors not ready yet');
                 return;
             }
 
-            // Get property keys from both schemas
-            const componentSchema = componentEditor.schema;
-            const rowSchema = rowEditor.schema;
-
-            const componentKeys = Object.keys(componentSchema.properties || {});
-            const rowKeys = Object.keys(rowSchema.properties || {});
-
             // Split the parameters
             const componentParams = {};
             const rowParams = {};
 
-            Object.keys(config).forEach(key => {
-                if (componentKeys.includes(key)) {
-                    componentParams[key] = config[key];
-                }
-                if (rowKeys.includes(key)) {
-                    rowParams[key] = config[key];
-                }
-            });
+            for (const key in config) {
+                const flags = configKeyFlags.get(key);
+                if (!flags) continue;
+                const value = config[key];
+                if (flags & COMPONENT_KEY) componentParams[key] = value;
+                if (flags & ROW_KEY) rowParams[key] = value;
+            }
 
-            // Pre-fill editors with loaded values
-            if (Object.keys(componentParams).length > 0) {
+            // Pre-fill editors with loaded values, skipping the rebuild when
+            // an editor already holds exactly these values (e.g. on a reload
+            // of an unchanged config)
+            building = true;
+            if (Object.keys(componentParams).length > 0 &&
+                    !jsonEqual(componentParams, valueOf(componentEditor))) {
                 componentEditor.setValue(componentParams);
                 console.log('Pre-filled component config:', componentParams);
             }
             if (Object.keys(rowParams).length > 0) {
-                rowEditor.setValue(rowParams);
-                console.log('Pre-filled row config:', rowParams);
+                if (rowEditor && rowEditor.ready) {
+                    if (!jsonEqual(rowParams, valueOf(rowEditor))) {
+                        rowEditor.setValue(rowParams);
+                        console.log('Pre-filled row config:', rowParams);
+                    }
+                } else {
+                    // Applied when the row editor is ready
+                    pendingRowConfig = rowParams;
+                }
             }
+
+            // JSONEditor fires 'change' on the next animation frame; render
+            // the outputs once after those events instead of per editor
+            requestAnimationFrame(() => {
+                building = false;
+                scheduleOutputs('component', 'row', 'combined');
+            });
         }
 
         // Show status message
@@ -801,12 +934,15 @@ HTML_CONTENT = """<!DOCTYPE html>
             const alertClass = type === 'success' ? 'alert-success' :
                               type === 'error' ? 'alert-danger' : 'alert-info';
 
-            const html = `<div class="alert ${alertClass}">${message}</div>`;
+            // Built as a node so appending doesn't re-parse earlier messages
+            const alert = document.createElement('div');
+            alert.className = `alert ${alertClass}`;
+            alert.textContent = message;
 
             if (append) {
-                statusDiv.innerHTML += html;
+                statusDiv.appendChild(alert);
             } else {
-                statusDiv.innerHTML = html;
+                statusDiv.replaceChildren(alert);
             }
         }
 
@@ -814,13 +950,22 @@ HTML_CONTENT = """<!DOCTYPE html>
         // ASYNC ACTIONS AND WATCH SUPPORT
         // ======================================
 
+        // Last merged sync-action parameters, reused while neither the
+        // component value nor the passed-in parameters object has changed
+        let lastMerge = { component: null, parameters: null, merged: null };
+
+        function mergeWithComponentConfig(parameters) {
+            const component = valueOf(componentEditor);
+            if (lastMerge.component !== component || lastMerge.parameters !== parameters) {
+                lastMerge = { component, parameters, merged: Object.assign({}, component, parameters) };
+            }
+            return lastMerge.merged;
+        }
+
         // Call sync action endpoint (hardcoded to /sync-action)
         async function callSyncAction(action, parameters) {
             // Merge component and row configs to create combined parameters
-            const combinedParameters = {
-                ...componentEditor.getValue(),
-                ...parameters
-            };
+            const combinedParameters = mergeWithComponentConfig(parameters);
 
             try {
                 const response = await fetch('/sync-action', {
@@ -842,9 +987,8 @@ HTML_CONTENT = """<!DOCTYPE html>
         }
 
         // Setup async field (dropdown with load button or auto-load)
-        function setupAsyncField(editor, fieldPath, schema, originalSchema) {
-            const prop = originalSchema.properties[fieldPath];
-            if (!prop || !prop.options?.async) return;
+        function setupAsyncField(editor, fieldPath, prop) {
+            if (!prop.options?.async) return;
 
             const asyncOptions = prop.options.async;
             const action = asyncOptions.action;
@@ -862,16 +1006,18 @@ HTML_CONTENT = """<!DOCTYPE html>
 
             // Create load function
             const loadOptions = async () => {
-                try {
-                    // Show loading state
-                    const selectElement = fieldEditor.input;
-                    if (selectElement) {
-                        selectElement.disabled = true;
-                        selectElement.style.opacity = '0.6';
-                    }
+                const selectElement = fieldEditor.input;
+                const isSelect = selectElement && selectElement.tagName === 'SELECT';
+
+                // Show loading state
+                if (selectElement) {
+                    selectElement.disabled = true;
+                    selectElement.style.opacity = '0.6';
+                }
 
+                try {
                     // Get current form values
-                    const parameters = editor.getValue();
+                    const parameters = valueOf(editor);
 
                     console.log(`Loading options for ${fieldPath} with action ${action}`);
                     const result = await callSyncAction(action, parameters);
@@ -890,53 +1036,44 @@ HTML_CONTENT = """<!DOCTYPE html>
 
                     // Update the field's enum with loaded options
                     if (options.length > 0) {
-                        // Extract values and labels from options
-                        // Options can be either {value, label} objects or plain strings
-                        const values = options.map(opt => typeof opt === 'object' ? opt.value : opt);
-                        const labels = options.map(opt => typeof opt === 'object' ? opt.label : opt);
-
-                        console.log(`Extracted values:`, values);
-
                         // Directly update the select element (simpler than JSONEditor API)
-                        const selectElement = fieldEditor.input;
-                        if (selectElement && selectElement.tagName === 'SELECT') {
-                            // Clear existing options
-                            selectElement.innerHTML = '';
+                        if (isSelect) {
+                            // Build the options off-DOM and swap them in with a
+                            // single mutation instead of one append per option
+                            const fragment = document.createDocumentFragment();
 
                             // Add empty option if field is not required
                             if (!prop.required) {
                                 const emptyOption = document.createElement('option');
                                 emptyOption.value = '';
                                 emptyOption.text = '-- Select --';
-                                selectElement.appendChild(emptyOption);
+                                fragment.appendChild(emptyOption);
                             }
 
                             // Add new options
-                            values.forEach((value, index) => {
+                            // Options can be either {value, label} objects or plain strings
+                            for (let i = 0; i < options.length; i++) {
+                                const opt = options[i];
+                                const isObject = typeof opt === 'object';
                                 const option = document.createElement('option');
-                                option.value = value;
-                                option.text = labels[index];
-                                selectElement.appendChild(option);
-                            });
+                                option.value = isObject ? opt.value : opt;
+                                option.text = isObject ? opt.label : opt;
+                                fragment.appendChild(option);
+                            }
+
+                            // Replaces the existing options
+                            selectElement.replaceChildren(fragment);
 
-                            console.log(`✅ Populated dropdown with ${values.length} options`);
+                            console.log(`✅ Populated dropdown with ${options.length} options`);
                         } else {
                             console.warn('Field is not a select element, cannot populate options');
                         }
                     }
-
-                    // Restore UI
-                    if (selectElement) {
-                        selectElement.disabled = false;
-                        selectElement.style.opacity = '1';
-                    }
-
                 } catch (error) {
                     console.error(`Error loading options for ${fieldPath}:`, error);
                     alert(`Failed to load options for ${prop.title || fieldPath}:\\n${error.message}`);
-
+                } finally {
                     // Restore UI
-                    const selectElement = fieldEditor.input;
                     if (selectElement) {
                         selectElement.disabled = false;
                         selectElement.style.opacity = '1';
@@ -944,26 +1081,20 @@ HTML_CONTENT = """<!DOCTYPE html>
                 }
             };
 
-            // Setup watch listeners if specified
+            // Setup watches if specified
             if (watchFields.length > 0) {
-                watchFields.forEach(watchField => {
-                    const watchFieldPath = `root.${watchField}`;
-
-                    // Watch for changes on the watched field
-                    editor.watch(watchFieldPath, () => {
-                        // Clear existing debounce timer
-                        const timerKey = `${fieldPath}_${watchField}`;
-                        if (watchDebounceTimers[timerKey]) {
-                            clearTimeout(watchDebounceTimers[timerKey]);
-                        }
-
-                        // Set new debounce timer (1 second)
-                        watchDebounceTimers[timerKey] = setTimeout(() => {
-                            console.log(`Watch triggered: ${watchField} changed, reloading ${fieldPath}`);
-                            loadOptions();
-                        }, 1000);
-                    });
-                });
+                // Debounce per field rather than per watched field, so edits
+                // to several watched fields in a row reload options once
+                const scheduleReload = () => {
+                    clearTimeout(pendingReloads.get(fieldEditor));
+                    pendingReloads.set(fieldEditor, setTimeout(() => {
+                        pendingReloads.delete(fieldEditor);
+                        console.log(`Watch triggered: ${watchFields.join(', ')} changed, reloading ${fieldPath}`);
+                        loadOptions();
+                    }, 1000));
+                };
+
+                addWatches(editor, watchFields, scheduleReload);
 
                 console.log(`Watch listeners setup for ${fieldPath} on fields: ${watchFields.join(', ')}`);
             }
@@ -971,10 +1102,11 @@ HTML_CONTENT = """<!DOCTYPE html>
             // Auto-load if specified
             if (autoload) {
                 // Give the editor time to fully initialize
-                setTimeout(() => {
+                pendingReloads.set(fieldEditor, setTimeout(() => {
+                    pendingReloads.delete(fieldEditor);
                     console.log(`Auto-loading options for ${fieldPath}`);
                     loadOptions();
-                }, 500);
+                }, 500));
             }
 
             // Add manual load button
@@ -999,108 +1131,170 @@ HTML_CONTENT = """<!DOCTYPE html>
             }
         }
 
-        // Setup watch listeners for all async fields in the schema
-        function setupWatchListeners(editor, schema, originalSchema, parentPath = '') {
-            if (!schema.properties) return;
-
-            Object.keys(schema.properties).forEach(fieldName => {
-                const fieldPath = parentPath ? `${parentPath}.${fieldName}` : fieldName;
-                const prop = originalSchema.properties[fieldName];
-
-                // Check if field has async options
-                if (prop && prop.format === 'select' && prop.options?.async) {
-                    setupAsyncField(editor, fieldPath, schema, originalSchema);
-                }
+        // Read a dotted path (e.g. "auth.host") out of an editor value
+        function valueAtPath(value, path) {
+            for (const key of path.split('.')) {
+                if (value == null) return undefined;
+                value = value[key];
+            }
+            return value;
+        }
+
+        // Comparable form of a watched value; objects and arrays are compared
+        // by content since getValue() returns fresh copies
+        function watchSnapshot(value) {
+            return value !== null && typeof value === 'object' ? JSON.stringify(value) : value;
+        }
+
+        // Run reload whenever one of watchFields changes in editor. Instead of
+        // a JSONEditor watch per (field, watched field) pair, each editor gets
+        // one 'change' handler that checks only the watched paths and
+        // schedules the fields depending on those that changed.
+        function addWatches(editor, watchFields, reload) {
+            let index = watchIndexes.get(editor);
+            if (!index) {
+                index = { dependents: new Map(), snapshot: new Map() };
+                watchIndexes.set(editor, index);
+
+                editor.on('change', () => {
+                    const value = valueOf(editor);
+                    const reloads = new Set();
+                    index.dependents.forEach((callbacks, path) => {
+                        const current = watchSnapshot(valueAtPath(value, path));
+                        if (current !== index.snapshot.get(path)) {
+                            index.snapshot.set(path, current);
+                            callbacks.forEach(callback => reloads.add(callback));
+                        }
+                    });
+                    reloads.forEach(callback => callback());
+                });
+            }
 
-                // Recursively handle nested objects
-                if (prop && prop.type === 'object' && prop.properties) {
-                    setupWatchListeners(editor, prop, prop, fieldPath);
+            const value = valueOf(editor);
+            watchFields.forEach(path => {
+                if (!index.dependents.has(path)) {
+                    index.dependents.set(path, new Set());
+                    index.snapshot.set(path, watchSnapshot(valueAtPath(value, path)));
                 }
+                index.dependents.get(path).add(reload);
             });
         }
 
-        // Setup action buttons (for button type fields)
-        function setupActionButtons(editor, schema, originalSchema, parentPath = '') {
-            if (!schema.properties) return;
+        // Flat [{fieldPath, prop}] list of every property in a schema, nested
+        // objects included, so setup passes don't each recurse through it
+        const flatSchemaCache = new WeakMap();
+
+        function flattenSchema(schema) {
+            let fields = flatSchemaCache.get(schema);
+            if (!fields) {
+                fields = [];
+                const walk = (node, parentPath) => {
+                    for (const name of Object.keys(node.properties || {})) {
+                        const prop = node.properties[name];
+                        const fieldPath = parentPath ? `${parentPath}.${name}` : name;
+                        fields.push({ fieldPath, prop });
+                        if (prop.type === 'object' && prop.properties) {
+                            walk(prop, fieldPath);
+                        }
+                    }
+                };
+                walk(schema, '');
+                flatSchemaCache.set(schema, fields);
+            }
+            return fields;
+        }
 
-            Object.keys(schema.properties).forEach(fieldName => {
-                const fieldPath = parentPath ? `${parentPath}.${fieldName}` : fieldName;
-                const processedProp = schema.properties[fieldName];
-                const originalProp = originalSchema.properties[fieldName];
+        // Setup watch listeners for all async fields in the (preprocessed) schema
+        function setupWatchListeners(editor, schema) {
+            for (const { fieldPath, prop } of flattenSchema(schema)) {
+                // Check if field has async options
+                if (prop.format === 'select' && prop.options?.async) {
+                    setupAsyncField(editor, fieldPath, prop);
+                }
+            }
+        }
 
+        // Setup action buttons (for button type fields, see preprocessSchema)
+        function setupActionButtons(editor, schema) {
+            // Read pass: collect each button field's elements up front, so the
+            // DOM writes below aren't interleaved with lookups
+            const buttonFields = [];
+            for (const { fieldPath, prop } of flattenSchema(schema)) {
                 // Check if this is a button field
-                if (originalProp && originalProp.type === 'button' && processedProp.options?._isButton) {
-                    const action = processedProp.options._action;
-                    const label = processedProp.options._label;
+                if (!prop.options?._isButton) continue;
 
-                    console.log(`Setting up button: ${fieldPath}, action: ${action}, label: ${label}`);
+                const action = prop.options._action;
+                const label = prop.options._label;
 
-                    // Find the field editor container
-                    const fieldEditor = editor.getEditor(`root.${fieldPath}`);
-                    if (fieldEditor && fieldEditor.container) {
-                        console.log(`Found field editor for ${fieldPath}`);
+                console.log(`Setting up button: ${fieldPath}, action: ${action}, label: ${label}`);
 
-                        // Hide the input element (it's already hidden via CSS but double-check)
-                        const inputElement = fieldEditor.input;
-                        if (inputElement) {
-                            inputElement.style.display = 'none';
-                        }
+                // Find the field editor container
+                const fieldEditor = editor.getEditor(`root.${fieldPath}`);
+                if (!fieldEditor || !fieldEditor.container) {
+                    console.warn(`Could not find field editor for: ${fieldPath}`);
+                    continue;
+                }
 
-                        // Hide the label too (makes it cleaner)
-                        const labelElement = fieldEditor.container.querySelector('label');
-                        if (labelElement) {
-                            labelElement.style.display = 'none';
-                        }
+                const container = fieldEditor.container;
+                buttonFields.push({
+                    fieldPath,
+                    action,
+                    label,
+                    container,
+                    inputElement: fieldEditor.input,
+                    labelElement: container.querySelector('label'),
+                    hasButton: container.querySelector('.sync-action-btn') !== null
+                });
+            }
 
-                        // Create action button
-                        if (!fieldEditor.container.querySelector('.sync-action-btn')) {
-                            const button = document.createElement('button');
-                            button.className = 'btn-primary sync-action-btn';
-                            button.textContent = `🔘 ${label}`;
-                            button.style.width = '100%';
-                            button.style.marginTop = '10px';
-                            button.style.padding = '12px';
-                            button.style.fontSize = '0.95rem';
-                            button.style.background = '#1BC98E';
-                            button.style.border = 'none';
-                            button.style.borderRadius = '4px';
-                            button.style.color = 'white';
-                            button.style.cursor = 'pointer';
-                            button.style.fontWeight = '600';
-
-                            button.onclick = async (e) => {
-                                e.preventDefault();
-                                await executeSyncAction(editor, action, label);
-                            };
-
-                            fieldEditor.container.appendChild(button);
-                            console.log(`✅ Button created for ${fieldPath}`);
-                        }
-                    } else {
-                        console.warn(`Could not find field editor for: ${fieldPath}`);
-                    }
+            // Write pass
+            for (const field of buttonFields) {
+                // Hide the input element (it's already hidden via CSS but double-check)
+                if (field.inputElement) {
+                    field.inputElement.style.display = 'none';
                 }
 
-                // Recursively handle nested objects
-                if (originalProp && originalProp.type === 'object' && originalProp.properties) {
-                    console.log(`Recursing into nested object: ${fieldPath}`);
-                    setupActionButtons(editor, processedProp, originalProp, fieldPath);
+                // Hide the label too (makes it cleaner)
+                if (field.labelElement) {
+                    field.labelElement.style.display = 'none';
                 }
-            });
+
+                // Create action button
+                if (!field.hasButton) {
+                    // Clicks are handled by the editor host (see onActionButtonClick)
+                    const button = document.createElement('button');
+                    button.className = 'btn-primary sync-action-btn';
+                    button.textContent = `🔘 ${field.label}`;
+                    button.dataset.action = field.action;
+                    button.dataset.label = field.label;
+
+                    field.container.appendChild(button);
+                    console.log(`✅ Button created for ${field.fieldPath}`);
+                }
+            }
         }
 
-        // Execute a sync action and show results
-        async function executeSyncAction(editor, action, label) {
+        // Delegated click handler for the action buttons inside an editor host,
+        // instead of a closure per button
+        function onActionButtonClick(e) {
+            const button = e.target.closest('.sync-action-btn');
+            if (!button) return;
+            e.preventDefault();
+
+            const editor = e.currentTarget.id === 'row-editor' ? rowEditor : componentEditor;
+            executeSyncAction(editor, button);
+        }
+
+        // Execute a button's sync action and show results
+        async function executeSyncAction(editor, button) {
+            const { action, label } = button.dataset;
             try {
-                const button = event.target;
                 button.disabled = true;
                 button.style.opacity = '0.6';
                 button.textContent = `⏳ ${label}...`;
 
-                // Get current form values (combined config)
-                const componentConfig = componentEditor ? componentEditor.getValue() : {};
-                const rowConfig = editor.getValue();
-                const parameters = {...componentConfig, ...rowConfig};
+                // Current form values; callSyncAction merges in the component config
+                const parameters = valueOf(editor);
 
                 // Call sync action
                 const result = await callSyncAction(action, parameters);
@@ -1116,7 +1310,6 @@ HTML_CONTENT = """<!DOCTYPE html>
                 button.style.opacity = '1';
                 button.textContent = `🔘 ${label}`;
             } catch (error) {
-                const button = event.target;
                 button.disabled = false;
                 button.style.opacity = '1';
                 button.textContent = `🔘 ${label}`;
@@ -1132,9 +1325,12 @@ HTML_CONTENT = """<!DOCTYPE html>
 
         // Preprocess schema to handle Keboola-specific features
         function preprocessSchema(schema) {
-            const processed = JSON.parse(JSON.stringify(schema)); // Deep clone
+            // Copy on write: only the top level and the properties changed
+            // below are copied, everything else is shared with the input
+            const processed = { ...schema };
 
-            if (processed.properties) {
+            if (schema.properties) {
+                processed.properties = { ...schema.properties };
                 Object.keys(processed.properties).forEach(key => {
                     const prop = processed.properties[key];
 
@@ -1163,15 +1359,21 @@ HTML_CONTENT = """<!DOCTYPE html>
                     // Handle async selects - keep them as selects (not readonly)
                     if (prop.format === 'select' && prop.options?.async) {
                         // Mark this field as having async loading
-                        if (!prop.options) prop.options = {};
-                        prop.options._hasAsync = true;
+                        processed.properties[key] = {
+                            ...prop,
+                            options: { ...prop.options, _hasAsync: true }
+                        };
                     }
 
                     // Ensure multiselect arrays work properly
                     if (prop.type === 'array' && prop.format === 'select') {
                         // JSONEditor needs these options for multiselect
-                        if (!prop.options) prop.options = {};
-                        prop.uniqueItems = true;
+                        const current = processed.properties[key];
+                        processed.properties[key] = {
+                            ...current,
+                            options: { ...current.options },
+                            uniqueItems: true
+                        };
                     }
                 });
             }
@@ -1179,24 +1381,119 @@ HTML_CONTENT = """<!DOCTYPE html>
             return processed;
         }
 
-        // Store original schemas for async field setup
-        let originalComponentSchema = null;
-        let originalRowSchema = null;
+        // Resolves once the component editor from the latest
+        // initializeEditors() is ready
+        let editorsReady = Promise.resolve();
+
+        // The row editor is only built once the row or combined tab has been
+        // opened; until then buildRowEditor holds the pending build and the
+        // row part of a loaded config waits in pendingRowConfig
+        let rowEditorWanted = false;
+        let buildRowEditor = null;
+        let pendingRowConfig = null;
+
+        // Select2 is only needed by JSONEditor for "format": "select2" fields,
+        // so it is fetched on demand instead of on every page load. It is a
+        // jQuery plugin, which is the only reason jQuery is ever loaded.
+        const JQUERY_JS = 'https://cdn.jsdelivr.net/npm/jquery@3.7.1/dist/jquery.min.js';
+        const SELECT2_JS = 'https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/dist/js/select2.min.js';
+        const SELECT2_CSS = 'https://cdn.jsdelivr.net/npm/select2@4.1.0-rc.0/dist/css/select2.min.css';
+        let select2Ready = null;
+
+        function loadScript(src) {
+            return new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = src;
+                script.onload = resolve;
+                script.onerror = () => reject(new Error(`Failed to load ${src}`));
+                document.head.appendChild(script);
+            });
+        }
+
+        function loadStylesheet(href) {
+            return new Promise((resolve, reject) => {
+                const link = document.createElement('link');
+                link.rel = 'stylesheet';
+                link.href = href;
+                link.onload = resolve;
+                link.onerror = () => reject(new Error(`Failed to load ${href}`));
+                document.head.appendChild(link);
+            });
+        }
+
+        function ensureSelect2() {
+            if (!select2Ready) {
+                select2Ready = Promise.all([
+                    loadScript(JQUERY_JS).then(() => loadScript(SELECT2_JS)),
+                    loadStylesheet(SELECT2_CSS)
+                ]);
+            }
+            return select2Ready;
+        }
+
+        // JSONEditor picks its select2 editor while building, so the library
+        // has to be in place before the editors are created. The serialized
+        // schema is searched so fields in array items, oneOf/anyOf/allOf
+        // branches and definitions are found too.
+        async function loadEditorDependencies(...schemas) {
+            const usesSelect2 = schemas.some(
+                schema => schema && JSON.stringify(schema).includes('"format":"select2"')
+            );
+            if (usesSelect2) {
+                try {
+                    await ensureSelect2();
+                } catch (error) {
+                    // Fields fall back to plain selects
+                    select2Ready = null;
+                    console.warn('Could not load Select2:', error);
+                }
+            }
+        }
+
+        // Editor -> function putting its host back in place, for editors
+        // destroyed before they became ready
+        const hostRestorers = new WeakMap();
+
+        function destroyEditor(editor) {
+            hostRestorers.get(editor)();
+            editor.destroy();
+        }
+
+        // Build an editor while its host element is detached from the page,
+        // so constructing each field doesn't force a layout; the host is put
+        // back in place once the editor is ready
+        function createEditorOffscreen(host, options) {
+            const placeholder = document.createComment('json-editor');
+            host.replaceWith(placeholder);
+
+            const restoreHost = () => {
+                if (placeholder.parentNode) placeholder.replaceWith(host);
+            };
+
+            try {
+                const editor = new JSONEditor(host, options);
+                editor.on('ready', restoreHost);
+                hostRestorers.set(editor, restoreHost);
+                return editor;
+            } catch (error) {
+                restoreHost();
+                throw error;
+            }
+        }
 
         // Initialize editors with schemas
         function initializeEditors(componentSchema, rowSchema) {
-            // Store original schemas
-            originalComponentSchema = componentSchema;
-            originalRowSchema = rowSchema;
+            // Index top-level keys for splitting a loaded config
+            configKeyFlags = buildConfigKeyFlags(componentSchema, rowSchema);
 
             // Preprocess schemas to handle Keboola-specific features
             const processedComponentSchema = preprocessSchema(componentSchema);
             const processedRowSchema = preprocessSchema(rowSchema);
 
             // Initialize Component Editor
-            if (componentEditor) componentEditor.destroy();
-            const componentElement = document.getElementById('component-editor');
-            componentEditor = new JSONEditor(componentElement, {
+            cancelPendingReloads();
+            if (componentEditor) destroyEditor(componentEditor);
+            componentEditor = createEditorOffscreen(componentHost, {
                 schema: processedComponentSchema,
                 theme: 'bootstrap5',
                 iconlib: 'bootstrap',
@@ -1214,25 +1511,41 @@ HTML_CONTENT = """<!DOCTYPE html>
                     width: '100%'
                 }
             });
+            cacheEditorValue(componentEditor);
 
             componentEditor.on('ready', function() {
                 componentEditor.on('change', function() {
-                    updateComponentOutput();
-                    updateCombinedOutput();
+                    if (building) return;
+                    scheduleOutputs('component', 'combined');
                 });
-                setTimeout(() => {
-                    updateComponentOutput();
-                    // Setup async fields and watch listeners
-                    setupWatchListeners(componentEditor, processedComponentSchema, originalComponentSchema);
-                    // Setup action buttons
-                    setupActionButtons(componentEditor, processedComponentSchema, originalComponentSchema);
-                }, 100);
+                scheduleOutputs('component');
+                // Setup async fields and watch listeners
+                setupWatchListeners(componentEditor, processedComponentSchema);
+                // Setup action buttons
+                setupActionButtons(componentEditor, processedComponentSchema);
             });
 
-            // Initialize Row Editor
-            if (rowEditor) rowEditor.destroy();
-            const rowElement = document.getElementById('row-editor');
-            rowEditor = new JSONEditor(rowElement, {
+            // Initialize Row Editor when it is first needed
+            if (rowEditor) destroyEditor(rowEditor);
+            rowEditor = null;
+            pendingRowConfig = null;
+            buildRowEditor = () => initializeRowEditor(processedRowSchema);
+            if (rowEditorWanted) ensureRowEditor();
+
+            editorsReady = new Promise(resolve => componentEditor.on('ready', resolve));
+        }
+
+        // Build the row editor if initializeEditors() left it pending
+        function ensureRowEditor() {
+            rowEditorWanted = true;
+            if (!buildRowEditor) return;
+            const build = buildRowEditor;
+            buildRowEditor = null;
+            build();
+        }
+
+        function initializeRowEditor(processedRowSchema) {
+            rowEditor = createEditorOffscreen(rowHost, {
                 schema: processedRowSchema,
                 theme: 'bootstrap5',
                 iconlib: 'bootstrap',
@@ -1250,20 +1563,24 @@ HTML_CONTENT = """<!DOCTYPE html>
                     width: '100%'
                 }
             });
+            cacheEditorValue(rowEditor);
 
             rowEditor.on('ready', function() {
                 rowEditor.on('change', function() {
-                    updateRowOutput();
-                    updateCombinedOutput();
+                    if (building) return;
+                    scheduleOutputs('row', 'combined');
                 });
-                setTimeout(() => {
-                    updateRowOutput();
-                    updateCombinedOutput();
-                    // Setup async fields and watch listeners
-                    setupWatchListeners(rowEditor, processedRowSchema, originalRowSchema);
-                    // Setup action buttons
-                    setupActionButtons(rowEditor, processedRowSchema, originalRowSchema);
-                }, 100);
+                // Replay the row part of a config loaded before the editor existed
+                if (pendingRowConfig) {
+                    rowEditor.setValue(pendingRowConfig);
+                    console.log('Pre-filled row config:', pendingRowConfig);
+                    pendingRowConfig = null;
+                }
+                scheduleOutputs('row', 'combined');
+                // Setup async fields and watch listeners
+                setupWatchListeners(rowEditor, processedRowSchema);
+                // Setup action buttons
+                setupActionButtons(rowEditor, processedRowSchema);
             });
         }
 
@@ -1289,41 +1606,46 @@ HTML_CONTENT = """<!DOCTYPE html>
 
         // Reload schemas (using manual paths if set, otherwise auto-discovery)
         async function reloadSchemas() {
-            document.getElementById('status').innerHTML = '';
+            cancelPendingReloads();
+            document.getElementById('status').replaceChildren();
 
             const componentConfigPath = document.getElementById('manual-component-config').value.trim();
             const configJsonPath = document.getElementById('manual-config-json').value.trim();
 
-            try {
-                // Load schemas (with optional manual path)
-                let schemaUrl = '/api/schemas';
-                if (componentConfigPath) {
-                    schemaUrl += `?path=${encodeURIComponent(componentConfigPath)}`;
-                }
+            // Schema and config paths (manual if set, otherwise auto-discovered)
+            let schemaUrl = '/api/schemas';
+            if (componentConfigPath) {
+                schemaUrl += `?path=${encodeURIComponent(componentConfigPath)}`;
+            }
+
+            let configUrl = '/api/config';
+            if (configJsonPath) {
+                configUrl += `?path=${encodeURIComponent(configJsonPath)}`;
+            }
 
-                const schemaResponse = await fetch(schemaUrl);
+            // Request both up front instead of one after the other
+            const schemaRequest = fetch(schemaUrl);
+            const configRequest = fetch(configUrl);
+            configRequest.catch(() => {});  // Surfaced below, once schemas are in
+
+            try {
+                const schemaResponse = await schemaRequest;
                 if (!schemaResponse.ok) {
                     throw new Error(`Failed to load schemas: ${schemaResponse.statusText}`);
                 }
                 const schemaData = await schemaResponse.json();
+                await loadEditorDependencies(schemaData.componentSchema, schemaData.rowSchema);
                 initializeEditors(schemaData.componentSchema, schemaData.rowSchema);
 
                 showStatus('success', '✅ Schemas loaded successfully');
 
-                // Load config (with optional manual path)
-                let configUrl = '/api/config';
-                if (configJsonPath) {
-                    configUrl += `?path=${encodeURIComponent(configJsonPath)}`;
-                }
-
-                const configResponse = await fetch(configUrl);
+                const configResponse = await configRequest;
                 if (configResponse.ok) {
                     const config = await configResponse.json();
                     if (Object.keys(config).length > 0) {
-                        setTimeout(() => {
-                            splitAndFillConfig(config);
-                            showStatus('success', '✅ Configuration loaded', true);
-                        }, 500);
+                        await editorsReady;
+                        splitAndFillConfig(config);
+                        showStatus('success', '✅ Configuration loaded', true);
                     }
                 }
             } catch (error) {
@@ -1332,56 +1654,166 @@ HTML_CONTENT = """<!DOCTYPE html>
             }
         }
 
-        // Update outputs
-        function updateComponentOutput() {
-            if (!componentEditor || !componentEditor.ready) return;
+        // Outputs larger than this only render the lines scrolled into view,
+        // so multi-megabyte configs don't lay out every character
+        const VIRTUALIZE_THRESHOLD = 64 * 1024;
+        const VIRTUALIZE_OVERSCAN = 50;  // Lines rendered above/below the view
 
-            const output = document.getElementById('component-output');
-            const errors = componentEditor.validate();
+        // Full text of each output <pre>, its lines when virtualized, and the
+        // spacer/slice nodes showing the visible window
+        const outputText = new WeakMap();
+        const outputLines = new WeakMap();
+        const outputViews = new WeakMap();
 
-            if (errors.length === 0) {
-                output.textContent = JSON.stringify(componentEditor.getValue(), null, 2);
-                output.style.borderColor = '#1BC98E';
-            } else {
-                output.textContent = JSON.stringify(componentEditor.getValue(), null, 2) +
-                    '\\n\\n// ERRORS:\\n' + JSON.stringify(errors, null, 2);
-                output.style.borderColor = '#dc3545';
+        function setOutputText(pre, text) {
+            outputText.set(pre, text);
+            if (text.length <= VIRTUALIZE_THRESHOLD) {
+                outputLines.delete(pre);
+                pre.textContent = text;
+                return;
             }
+
+            outputLines.set(pre, text.split('\\n'));
+            if (!outputViews.has(pre)) {
+                let frame = 0;
+                pre.addEventListener('scroll', () => {
+                    if (frame) return;
+                    frame = requestAnimationFrame(() => {
+                        frame = 0;
+                        renderOutputWindow(pre);
+                    });
+                }, { passive: true });
+            }
+            renderOutputWindow(pre);
+        }
+
+        // Render the visible lines of a large output inside a spacer as tall
+        // as the whole text, keeping the scrollbar true to the full size
+        function renderOutputWindow(pre) {
+            const lines = outputLines.get(pre);
+            if (!lines) return;
+
+            let view = outputViews.get(pre);
+            if (!view || view.spacer.parentNode !== pre) {
+                const spacer = document.createElement('div');
+                spacer.style.position = 'relative';
+                const slice = document.createElement('div');
+                slice.style.position = 'absolute';
+                slice.style.left = '0';
+                spacer.appendChild(slice);
+                pre.replaceChildren(spacer);
+                view = { spacer, slice };
+                outputViews.set(pre, view);
+            }
+
+            const lineHeight = parseFloat(getComputedStyle(pre).lineHeight) || 20;
+            const first = Math.max(0, Math.floor(pre.scrollTop / lineHeight) - VIRTUALIZE_OVERSCAN);
+            const last = Math.min(lines.length,
+                Math.ceil((pre.scrollTop + pre.clientHeight) / lineHeight) + VIRTUALIZE_OVERSCAN);
+
+            view.spacer.style.height = `${lines.length * lineHeight}px`;
+            view.slice.style.top = `${first * lineHeight}px`;
+            view.slice.textContent = lines.slice(first, last).join('\\n');
+        }
+
+        // Editor value(s) each output pane last rendered. valueOf() returns the
+        // same object until the next edit, so a pane whose value is unchanged
+        // skips validate() and JSON.stringify entirely.
+        const renderedValues = new WeakMap();
+
+        // Validation only colours a pane's border and appends the error list,
+        // so it runs when the browser is idle rather than on every refresh
+        const scheduleIdle = window.requestIdleCallback
+            ? callback => requestIdleCallback(callback, { timeout: 500 })
+            : callback => setTimeout(callback, 0);
+
+        function renderEditorOutput(editor, output) {
+            const value = valueOf(editor);
+            if (renderedValues.get(output) === value) return;
+            renderedValues.set(output, value);
+
+            const json = JSON.stringify(value, null, 2);
+            setOutputText(output, json);
+
+            scheduleIdle(() => {
+                // Skip if the pane moved on or the editor was replaced meanwhile
+                if (renderedValues.get(output) !== value) return;
+                if (editor !== componentEditor && editor !== rowEditor) return;
+
+                const errors = editor.validate();
+                if (errors.length === 0) {
+                    output.style.borderColor = '#1BC98E';
+                } else {
+                    setOutputText(output, json +
+                        '\\n\\n// ERRORS:\\n' + JSON.stringify(errors, null, 2));
+                    output.style.borderColor = '#dc3545';
+                }
+            });
+        }
+
+        // Update outputs
+        function updateComponentOutput() {
+            if (!componentEditor || !componentEditor.ready) return;
+            renderEditorOutput(componentEditor, document.getElementById('component-output'));
         }
 
         function updateRowOutput() {
             if (!rowEditor || !rowEditor.ready) return;
+            renderEditorOutput(rowEditor, document.getElementById('row-output'));
+        }
 
-            const output = document.getElementById('row-output');
-            const errors = rowEditor.validate();
+        // Worker that pretty-prints the combined config off the main thread,
+        // created on first use; null if workers are unavailable
+        let stringifyWorker;
+        let combinedSeq = 0;  // Only the latest request's result is shown
 
-            if (errors.length === 0) {
-                output.textContent = JSON.stringify(rowEditor.getValue(), null, 2);
-                output.style.borderColor = '#1BC98E';
-            } else {
-                output.textContent = JSON.stringify(rowEditor.getValue(), null, 2) +
-                    '\\n\\n// ERRORS:\\n' + JSON.stringify(errors, null, 2);
-                output.style.borderColor = '#dc3545';
+        function getStringifyWorker() {
+            if (stringifyWorker === undefined) {
+                try {
+                    const source = 'onmessage = e => postMessage({ seq: e.data.seq, text: JSON.stringify(e.data.value, null, 2) });';
+                    stringifyWorker = new Worker(URL.createObjectURL(
+                        new Blob([source], { type: 'application/javascript' })));
+                    stringifyWorker.onmessage = e => {
+                        if (e.data.seq === combinedSeq) {
+                            setOutputText(document.getElementById('combined-output'), e.data.text);
+                        }
+                    };
+                } catch (error) {
+                    console.warn('Stringifying on the main thread:', error);
+                    stringifyWorker = null;
+                }
             }
+            return stringifyWorker;
         }
 
         function updateCombinedOutput() {
+            if (!combinedVisible) return;
             if (!componentEditor || !componentEditor.ready || !rowEditor || !rowEditor.ready) return;
 
+            const output = document.getElementById('combined-output');
+            const componentValue = valueOf(componentEditor);
+            const rowValue = valueOf(rowEditor);
+            const rendered = renderedValues.get(output);
+            if (rendered && rendered[0] === componentValue && rendered[1] === rowValue) return;
+            renderedValues.set(output, [componentValue, rowValue]);
+
             const combined = {
-                parameters: {
-                    ...componentEditor.getValue(),
-                    ...rowEditor.getValue()
-                }
+                parameters: Object.assign({}, componentValue, rowValue)
             };
 
-            document.getElementById('combined-output').textContent =
-                JSON.stringify(combined, null, 2);
+            const seq = ++combinedSeq;
+            const worker = typeof Worker === 'undefined' ? null : getStringifyWorker();
+            if (worker) {
+                worker.postMessage({ seq, value: combined });
+            } else {
+                setOutputText(output, JSON.stringify(combined, null, 2));
+            }
         }
 
         // Copy to clipboard
         function copyToClipboard() {
-            const text = document.getElementById('combined-output').textContent;
+            const output = document.getElementById('combined-output');
+            const text = outputText.get(output) ?? output.textContent;
             navigator.clipboard.writeText(text).then(() => {
                 alert('✅ Copied to clipboard!');
             }).catch(err => {
@@ -1428,16 +1860,44 @@ HTML_CONTENT = """<!DOCTYPE html>
         }
 
         window.addEventListener('DOMContentLoaded', () => {
+            componentHost = document.getElementById('component-editor');
+            rowHost = document.getElementById('row-editor');
+
             loadDiscoveryInfo();  // Pre-fill manual paths
-            loadSchemas();
-            // Wait for editors to initialize, then load config
-            setTimeout(loadConfig, 500);
+
+            // Request schemas and config in parallel; the config is applied
+            // once the editors built from the schemas are ready
+            const schemasLoaded = loadSchemas(fetch('/api/schemas'));
+            loadConfig(fetch('/api/config'), schemasLoaded);
+
+            // Action buttons are recreated with the editors; their hosts persist
+            componentHost.addEventListener('click', onActionButtonClick);
+            rowHost.addEventListener('click', onActionButtonClick);
+
+            // Build the row editor when its tab is first opened
+            document.getElementById('row-tab').addEventListener('shown.bs.tab', ensureRowEditor);
+
+            // Render the combined config when its tab is opened; it needs the
+            // row editor's values, so that is built too
+            const combinedTab = document.getElementById('combined-tab');
+            combinedTab.addEventListener('shown.bs.tab', () => {
+                combinedVisible = true;
+                ensureRowEditor();
+                scheduleOutputs('combined');
+            });
+            combinedTab.addEventListener('hidden.bs.tab', () => {
+                combinedVisible = false;
+            });
         });
     </script>
 </body>
 </html>
 """
 
+# The page is static, so encode and compress it once at import time
+HTML_CONTENT_BYTES = HTML_CONTENT.encode('utf-8')
+HTML_CONTENT_GZIP = gzip.compress(HTML_CONTENT_BYTES, compresslevel=9)
+
 
 # ============================================================================
 # MAIN ENTRY POINT